@@ -6,19 +6,33 @@ Primary VLM implementation for Flow. Supports up to 3 images.
 
 from __future__ import annotations
 
-import argparse
 import base64
+import functools
+import importlib
 import io
 import json
 import os
+import re
+import socket
+import socketserver
+import struct
 import sys
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Sequence
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+@dataclass(slots=True, frozen=True)
 class VLMValidationResult:
     """Result of VLM screenshot validation."""
 
@@ -44,13 +58,30 @@ def load_api_key(env_path: Optional[Path] = None) -> str:
     if env_path is None:
         env_path = Path.home() / ".flow" / "env"
 
-    if not env_path.exists():
+    env_path = Path(env_path)
+    try:
+        mtime_ns = env_path.stat().st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Gemini API key not found.\n"
             f"Set GEMINI_API_KEY environment variable, or\n"
             f"Create {env_path} with: GEMINI_API_KEY=your_key_here"
-        )
+        ) from None
+
+    return _load_api_key_from_file(str(env_path), mtime_ns)
+
+
+def clear_api_key_cache() -> None:
+    """Forget env files read by load_api_key (they are re-read on change anyway)."""
+    _load_api_key_from_file.cache_clear()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_api_key_from_file(env_path: str, mtime_ns: int) -> str:
+    """Read the key from env_path; cached until the file's mtime changes.
 
+    A long-lived --serve/--stdio worker therefore picks up a rotated key.
+    """
     with open(env_path, "r", encoding="utf-8") as f:
         for line in f:
             line = line.strip()
@@ -67,6 +98,30 @@ def load_api_key(env_path: Optional[Path] = None) -> str:
     )
 
 
+class TokenBucket:
+    """Thread-safe token bucket used to pace Gemini API requests."""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, n: float = 1) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+            self.last_refill = now
+
+            if self.tokens < n:
+                time.sleep((n - self.tokens) / self.refill_rate)
+                self.tokens = n
+                self.last_refill = time.monotonic()
+
+            self.tokens -= n
+
+
 VALIDATION_PROMPT = """You are a UI test validator. Analyze this screenshot.
 
 You are given {image_count} image(s) (up to 3).
@@ -83,6 +138,135 @@ Answer ONLY in JSON format (no markdown, no extra text):
 """
 
 
+# Stand-in for "expected" while a template is pre-rendered; cannot occur in
+# a real prompt.
+_EXPECTED_SLOT = "\x00expected\x00"
+
+
+@functools.lru_cache(maxsize=8)
+def _split_template(template: str, image_count: int) -> Optional[tuple[str, str]]:
+    """Render template once around the expected slot, as (prefix, suffix).
+
+    Returns None when the slot is not a single plain "{expected}" field, in
+    which case the caller formats the template the ordinary way.
+    """
+    if "{expected}" not in template:
+        return None
+    try:
+        rendered = template.format(expected=_EXPECTED_SLOT, image_count=image_count)
+    except KeyError:
+        rendered = template.format(expected=_EXPECTED_SLOT)
+    # Count in the rendered text: an escaped "{{expected}}" is literal there.
+    if rendered.count(_EXPECTED_SLOT) != 1:
+        return None
+    prefix, _, suffix = rendered.partition(_EXPECTED_SLOT)
+    return prefix, suffix
+
+
+# VALIDATION_PROMPT with image_count already applied and braces unescaped,
+# split around the expected text so each prompt is two concatenations.
+_DEFAULT_PROMPTS = {
+    count: _split_template(VALIDATION_PROMPT, count)
+    for count in (1, 2, 3)
+}
+
+_LAZY_MODULES = {
+    "Image": "PIL.Image",
+    "genai": "google.genai",
+    "types": "google.genai.types",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _lazy_import(name: str):
+    """Import a heavy optional dependency on first use and keep it for the process."""
+    return importlib.import_module(_LAZY_MODULES[name])
+
+
+def __getattr__(name: str):
+    if name in _LAZY_MODULES:
+        return _lazy_import(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Leading signature bytes -> MIME type, keyed by signature length.
+_IMAGE_MAGIC = {
+    8: {b"\x89PNG\r\n\x1a\n": "image/png"},
+    3: {b"\xff\xd8\xff": "image/jpeg"},
+}
+
+
+def _sniff_mime_type(image_bytes: bytes) -> str:
+    """MIME type from the file signature; Pillow is only consulted for unknown formats."""
+    for length, signatures in _IMAGE_MAGIC.items():
+        mime_type = signatures.get(image_bytes[:length])
+        if mime_type is not None:
+            return mime_type
+    if image_bytes[:4] == b"RIFF" and image_bytes[8:12] == b"WEBP":
+        return "image/webp"
+
+    try:
+        Image = _lazy_import("Image")
+    except ImportError:
+        return "image/png"
+    return GeminiValidator._get_image_mime_type(Image.open(io.BytesIO(image_bytes)))
+
+
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.MULTILINE)
+_OBJECT_START_RE = re.compile(r'\{\s*"')
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _verdict(result: dict) -> Optional[dict]:
+    """Normalize a parsed model answer, or None if its fields are malformed."""
+    try:
+        return {
+            "pass": bool(result.get("pass", False)),
+            "confidence": float(result.get("confidence", 0.0)),
+            "reason": str(result.get("reason", "No reason provided")),
+        }
+    except (TypeError, ValueError):
+        return None
+
+
+_BATCH_TERMINAL_STATES = frozenset({
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+})
+
+
+def _batch_state_name(job) -> str:
+    state = getattr(job, "state", None)
+    return getattr(state, "name", None) or str(state)
+
+
+@dataclass(slots=True)
+class _DecodedImages:
+    """Decoded screenshots kept as parallel byte and MIME-type lists."""
+
+    data: list[bytes] = field(default_factory=list)
+    mime_types: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def add(self, image_bytes: bytes, mime_type: str) -> None:
+        self.data.append(image_bytes)
+        self.mime_types.append(mime_type)
+
+
+def _extract_response_text(response: dict) -> str:
+    """Join the text parts of the first candidate in a raw GenerateContentResponse dict."""
+    for candidate in response.get("candidates") or []:
+        parts = (candidate.get("content") or {}).get("parts") or []
+        text = "".join(part.get("text", "") for part in parts)
+        if text:
+            return text
+    return json.dumps(response, ensure_ascii=False)
+
+
 class GeminiValidator:
     """Validates screenshots using Gemini VLM."""
 
@@ -90,7 +274,12 @@ class GeminiValidator:
     DEFAULT_CONFIDENCE_THRESHOLD = 0.8
     DEFAULT_TEMPERATURE = 0.0
     DEFAULT_TOP_P = 0.0
-    MIN_REQUEST_INTERVAL = 0.1
+    RATE_LIMIT_CAPACITY = 10
+    RATE_LIMIT_REFILL_RATE = 10.0
+    BATCH_POLL_INITIAL_INTERVAL = 5.0
+    BATCH_POLL_MAX_INTERVAL = 60.0
+    BATCH_TIMEOUT = 24 * 60 * 60
+    MAX_IMAGE_BYTES = 4 * 1024 * 1024
 
     def __init__(
         self,
@@ -105,14 +294,16 @@ class GeminiValidator:
         self.confidence_threshold = confidence_threshold
         self.temperature = temperature
         self.top_p = top_p
-        self._last_request_time = 0.0
+        self._bucket = TokenBucket(
+            capacity=self.RATE_LIMIT_CAPACITY,
+            refill_rate=self.RATE_LIMIT_REFILL_RATE,
+        )
+        self._decode_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="flow-vlm-decode")
         self._client = None
 
     def _get_client(self):
         if self._client is None:
-            from google import genai
-
-            self._client = genai.Client(api_key=self.api_key)
+            self._client = _lazy_import("genai").Client(api_key=self.api_key)
         return self._client
 
     @staticmethod
@@ -145,48 +336,103 @@ class GeminiValidator:
         prompt_template: Optional[str] = None,
     ) -> VLMValidationResult:
         try:
-            from PIL import Image
-        except ImportError:
-            return VLMValidationResult(
-                passed=False,
-                confidence=0.0,
-                reason="Pillow not installed. Run: pip install pillow",
-            )
+            decoded_images, error = self._decode_screenshots(screenshot_data_list)
+        except Exception as e:
+            return VLMValidationResult(False, 0.0, f"VLM validation error: {str(e)}")
+        if error is not None:
+            return error
+
+        return self._validate_decoded(decoded_images, expected, prompt_template)
+
+    def validate_image_bytes(
+        self,
+        images: Sequence[bytes],
+        expected: str,
+        prompt_template: Optional[str] = None,
+    ) -> VLMValidationResult:
+        """Validate raw image bytes (e.g. received over the stdio worker pipe).
 
+        The bytes go to Gemini as inline parts unchanged. Only a size check
+        and a magic-byte sniff run per image, so no decode pool is used.
+        """
         try:
-            if not screenshot_data_list:
-                return VLMValidationResult(False, 0.0, "At least one screenshot is required.")
-
-            if len(screenshot_data_list) > 3:
-                return VLMValidationResult(
-                    False,
-                    0.0,
-                    f"Maximum 3 screenshots supported (got {len(screenshot_data_list)}).",
-                )
+            decoded_images, error = self._load_images(images, self._inspect_image, parallel=False)
+        except Exception as e:
+            return VLMValidationResult(False, 0.0, f"VLM validation error: {str(e)}")
+        if error is not None:
+            return error
 
-            decoded_images: list[tuple[bytes, str]] = []
-            for screenshot_data in screenshot_data_list:
-                image_bytes = base64.b64decode(screenshot_data)
-                if len(image_bytes) > 4 * 1024 * 1024:
-                    return VLMValidationResult(False, 0.0, "One or more screenshots exceed 4MB limit.")
+        return self._validate_decoded(decoded_images, expected, prompt_template)
 
-                image = Image.open(io.BytesIO(image_bytes))
-                mime_type = self._get_image_mime_type(image)
-                decoded_images.append((image_bytes, mime_type))
+    def validate_screenshot_file(self, screenshot_path: Path, expected: str) -> VLMValidationResult:
+        return self.validate_screenshot_files([screenshot_path], expected)
 
-            self._rate_limit()
+    def validate_screenshot_files(self, screenshot_paths: Sequence[Path], expected: str) -> VLMValidationResult:
+        if not screenshot_paths:
+            return VLMValidationResult(False, 0.0, "At least one screenshot path is required.")
+        if len(screenshot_paths) > 3:
+            return VLMValidationResult(False, 0.0, f"Maximum 3 screenshots supported (got {len(screenshot_paths)}).")
+
+        screenshot_paths = [Path(screenshot_path) for screenshot_path in screenshot_paths]
+        try:
+            decoded_images, error = self._read_screenshot_files(screenshot_paths)
+        except Exception as e:
+            return VLMValidationResult(False, 0.0, f"VLM validation error: {str(e)}")
+        if error is not None:
+            return error
+
+        return self._validate_decoded(decoded_images, expected)
+
+    def validate_screenshots_batch(
+        self,
+        items: Sequence[tuple[Sequence[str], str]],
+        prompt_template: Optional[str] = None,
+    ) -> list[VLMValidationResult]:
+        """Validate many (screenshots, expected) pairs through one Gemini Batch job.
+
+        Batch jobs are billed at a discount but complete asynchronously, so this
+        is meant for non-interactive runs where latency does not matter.
+        """
+        prepared = []
+        for screenshot_data_list, expected in items:
+            try:
+                decoded_images, error = self._decode_screenshots(screenshot_data_list)
+            except Exception as e:
+                decoded_images, error = _DecodedImages(), VLMValidationResult(False, 0.0, f"VLM validation error: {str(e)}")
+            prepared.append((decoded_images, error, expected))
+
+        return self._validate_decoded_batch(prepared, prompt_template)
 
-            template = prompt_template or VALIDATION_PROMPT
+    def validate_screenshot_files_batch(
+        self,
+        items: Sequence[tuple[Sequence[Path], str]],
+    ) -> list[VLMValidationResult]:
+        prepared = []
+        for screenshot_paths, expected in items:
+            screenshot_paths = [Path(screenshot_path) for screenshot_path in screenshot_paths]
             try:
-                prompt = template.format(expected=expected, image_count=len(decoded_images))
-            except KeyError:
-                prompt = template.format(expected=expected)
+                decoded_images, error = self._read_screenshot_files(screenshot_paths)
+            except Exception as e:
+                decoded_images, error = _DecodedImages(), VLMValidationResult(False, 0.0, f"VLM validation error: {str(e)}")
+            prepared.append((decoded_images, error, expected))
+
+        return self._validate_decoded_batch(prepared)
+
+    def _validate_decoded(
+        self,
+        decoded_images: _DecodedImages,
+        expected: str,
+        prompt_template: Optional[str] = None,
+    ) -> VLMValidationResult:
+        try:
+            self._rate_limit()
 
-            from google.genai import types
+            prompt = self._build_prompt(prompt_template, expected, len(decoded_images))
 
+            types = _lazy_import("types")
             client = self._get_client()
             contents = [types.Part.from_text(text=prompt)]
-            for image_bytes, mime_type in decoded_images:
+            for image_bytes, mime_type in zip(decoded_images.data, decoded_images.mime_types):
                 contents.append(types.Part.from_bytes(data=image_bytes, mime_type=mime_type))
 
             response = client.models.generate_content(
@@ -199,21 +445,7 @@ class GeminiValidator:
             )
 
             response_text = response.text if hasattr(response, "text") else str(response)
-            result = self._parse_response(response_text)
-
-            warning = None
-            if result["confidence"] < self.confidence_threshold:
-                warning = (
-                    f"Low confidence: {result['confidence']:.2f} "
-                    f"(threshold: {self.confidence_threshold})"
-                )
-
-            return VLMValidationResult(
-                passed=result["pass"],
-                confidence=result["confidence"],
-                reason=result["reason"],
-                warning=warning,
-            )
+            return self._build_result(response_text)
 
         except Exception as e:
             return VLMValidationResult(
@@ -222,61 +454,248 @@ class GeminiValidator:
                 reason=f"VLM validation error: {str(e)}",
             )
 
-    def validate_screenshot_file(self, screenshot_path: Path, expected: str) -> VLMValidationResult:
-        screenshot_path = Path(screenshot_path)
-        if not screenshot_path.exists():
-            return VLMValidationResult(False, 0.0, f"Screenshot file not found: {screenshot_path}")
+    def _validate_decoded_batch(
+        self,
+        prepared: Sequence[tuple[_DecodedImages, Optional[VLMValidationResult], str]],
+        prompt_template: Optional[str] = None,
+    ) -> list[VLMValidationResult]:
+        results: list[Optional[VLMValidationResult]] = [error for _, error, _ in prepared]
+        lines: list[str] = []
+
+        for index, (decoded_images, error, expected) in enumerate(prepared):
+            if error is not None:
+                continue
+
+            try:
+                prompt = self._build_prompt(prompt_template, expected, len(decoded_images))
+            except Exception as e:
+                # A template that fails for one item must not sink the others.
+                results[index] = VLMValidationResult(False, 0.0, f"VLM validation error: {str(e)}")
+                continue
+            parts: list[dict] = [{"text": prompt}]
+            for image_bytes, mime_type in zip(decoded_images.data, decoded_images.mime_types):
+                parts.append({
+                    "inline_data": {
+                        "mime_type": mime_type,
+                        "data": base64.b64encode(image_bytes).decode("ascii"),
+                    }
+                })
+
+            lines.append(json.dumps({
+                "key": str(index),
+                "request": {
+                    "contents": [{"role": "user", "parts": parts}],
+                    "generation_config": {
+                        "temperature": self.temperature,
+                        "top_p": self.top_p,
+                    },
+                },
+            }))
+
+        if lines:
+            try:
+                responses = self._run_batch_job(lines)
+            except Exception as e:
+                responses = {}
+                batch_error = f"VLM batch error: {str(e)}"
+            else:
+                batch_error = "VLM batch returned no response for this request."
+
+            for index, result in enumerate(results):
+                if result is not None:
+                    continue
+                response_text = responses.get(str(index))
+                if response_text is None:
+                    results[index] = VLMValidationResult(False, 0.0, batch_error)
+                else:
+                    results[index] = self._build_result(response_text)
+
+        return results
+
+    def _run_batch_job(self, lines: Sequence[str]) -> dict[str, str]:
+        """Upload JSONL requests, wait for the batch job, and return text keyed by request key."""
+        import tempfile
+
+        types = _lazy_import("types")
+        client = self._get_client()
+
+        with tempfile.TemporaryDirectory(prefix="flow-vlm-batch-") as tmp_dir:
+            jsonl_path = Path(tmp_dir) / "requests.jsonl"
+            jsonl_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            uploaded = client.files.upload(
+                file=str(jsonl_path),
+                config=types.UploadFileConfig(display_name="flow-vlm-batch", mime_type="jsonl"),
+            )
+
+        self._rate_limit()
+        job = client.batches.create(
+            model=self.model_name,
+            src=uploaded.name,
+            config={"display_name": "flow-vlm-batch"},
+        )
+
+        delay = self.BATCH_POLL_INITIAL_INTERVAL
+        deadline = time.monotonic() + self.BATCH_TIMEOUT
+        while _batch_state_name(job) not in _BATCH_TERMINAL_STATES:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Batch job {job.name} did not finish within {self.BATCH_TIMEOUT}s")
+            time.sleep(delay)
+            delay = min(delay * 2, self.BATCH_POLL_MAX_INTERVAL)
+            job = client.batches.get(name=job.name)
+
+        state = _batch_state_name(job)
+        if state != "JOB_STATE_SUCCEEDED":
+            raise RuntimeError(f"Batch job {job.name} ended with state {state}")
+
+        raw = client.files.download(file=job.dest.file_name)
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+
+        responses: dict[str, str] = {}
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            entry = _loads(line)
+            response = entry.get("response")
+            if response is not None:
+                responses[str(entry.get("key"))] = _extract_response_text(response)
+        return responses
+
+    def _decode_screenshots(
+        self,
+        screenshot_data_list: Sequence[str],
+    ) -> tuple[_DecodedImages, Optional[VLMValidationResult]]:
+        return self._load_images(screenshot_data_list, self._decode_one)
+
+    def _read_screenshot_files(
+        self,
+        screenshot_paths: Sequence[Path],
+    ) -> tuple[_DecodedImages, Optional[VLMValidationResult]]:
+        # Reads overlap on the decode pool; a missing file surfaces from open()
+        # instead of a separate exists() pass over every path.
+        try:
+            return self._load_images(screenshot_paths, self._read_one)
+        except FileNotFoundError as e:
+            return _DecodedImages(), VLMValidationResult(False, 0.0, f"Screenshot file not found: {e.filename}")
+
+    def _load_images(
+        self,
+        sources: Sequence,
+        loader,
+        parallel: bool = True,
+    ) -> tuple[_DecodedImages, Optional[VLMValidationResult]]:
+        if not sources:
+            return _DecodedImages(), VLMValidationResult(False, 0.0, "At least one screenshot is required.")
 
+        if len(sources) > 3:
+            return _DecodedImages(), VLMValidationResult(
+                False,
+                0.0,
+                f"Maximum 3 screenshots supported (got {len(sources)}).",
+            )
+
+        oversized = VLMValidationResult(False, 0.0, "One or more screenshots exceed 4MB limit.")
+
+        decoded_images = _DecodedImages()
+        if len(sources) == 1 or not parallel:
+            for source in sources:
+                decoded = loader(source)
+                if decoded is None:
+                    return decoded_images, oversized
+                decoded_images.add(*decoded)
+            return decoded_images, None
+
+        futures = [self._decode_pool.submit(loader, source) for source in sources]
+        for future in as_completed(futures):
+            if future.result() is None:
+                for pending in futures:
+                    pending.cancel()
+                return decoded_images, oversized
+
+        for future in futures:
+            decoded_images.add(*future.result())
+        return decoded_images, None
+
+    def _decode_one(self, screenshot_data: str) -> Optional[tuple[bytes, str]]:
+        # Reject from the encoded length before b64decode allocates the buffer.
+        padding = 2 if screenshot_data.endswith("==") else 1 if screenshot_data.endswith("=") else 0
+        if len(screenshot_data) * 3 // 4 - padding > self.MAX_IMAGE_BYTES:
+            return None
+        return self._inspect_image(base64.b64decode(screenshot_data))
+
+    def _read_one(self, screenshot_path: Path) -> Optional[tuple[bytes, str]]:
         with open(screenshot_path, "rb") as f:
-            data = base64.b64encode(f.read()).decode("utf-8")
-        return self.validate_screenshot(data, expected)
+            return self._inspect_image(f.read())
 
-    def validate_screenshot_files(self, screenshot_paths: Sequence[Path], expected: str) -> VLMValidationResult:
-        if not screenshot_paths:
-            return VLMValidationResult(False, 0.0, "At least one screenshot path is required.")
-        if len(screenshot_paths) > 3:
-            return VLMValidationResult(False, 0.0, f"Maximum 3 screenshots supported (got {len(screenshot_paths)}).")
+    def _inspect_image(self, image_bytes: bytes) -> Optional[tuple[bytes, str]]:
+        """Sniff the MIME type of raw image bytes; None if they exceed the size limit."""
+        if len(image_bytes) > self.MAX_IMAGE_BYTES:
+            return None
+        return image_bytes, _sniff_mime_type(image_bytes)
+
+    @staticmethod
+    def _build_prompt(prompt_template: Optional[str], expected: str, image_count: int) -> str:
+        default = not prompt_template or prompt_template is VALIDATION_PROMPT
+        if default and image_count in _DEFAULT_PROMPTS:
+            prefix, suffix = _DEFAULT_PROMPTS[image_count]
+            return f"{prefix}{expected}{suffix}"
+
+        template = prompt_template or VALIDATION_PROMPT
+        split = _split_template(template, image_count)
+        if split is not None:
+            return f"{split[0]}{expected}{split[1]}"
+        try:
+            return template.format(expected=expected, image_count=image_count)
+        except KeyError:
+            return template.format(expected=expected)
 
-        encoded_images: list[str] = []
-        for screenshot_path in screenshot_paths:
-            screenshot_path = Path(screenshot_path)
-            if not screenshot_path.exists():
-                return VLMValidationResult(False, 0.0, f"Screenshot file not found: {screenshot_path}")
-            with open(screenshot_path, "rb") as f:
-                encoded_images.append(base64.b64encode(f.read()).decode("utf-8"))
+    def _build_result(self, response_text: str) -> VLMValidationResult:
+        result = self._parse_response(response_text)
 
-        return self.validate_screenshots(encoded_images, expected)
+        warning = None
+        if result["confidence"] < self.confidence_threshold:
+            warning = (
+                f"Low confidence: {result['confidence']:.2f} "
+                f"(threshold: {self.confidence_threshold})"
+            )
+
+        return VLMValidationResult(
+            passed=result["pass"],
+            confidence=result["confidence"],
+            reason=result["reason"],
+            warning=warning,
+        )
 
     def _rate_limit(self) -> None:
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.MIN_REQUEST_INTERVAL:
-            time.sleep(self.MIN_REQUEST_INTERVAL - elapsed)
-        self._last_request_time = time.time()
+        self._bucket.consume(1)
 
     @staticmethod
     def _parse_response(text: str) -> dict:
-        text = text.strip()
-        if text.startswith("```"):
-            lines = text.split("\n")
-            text = "\n".join(lines[1:])
-            if text.endswith("```"):
-                text = text[:-3]
-            text = text.strip()
-
-        start = text.find("{")
-        end = text.rfind("}") + 1
-
-        if start != -1 and end > start:
-            json_text = text[start:end]
-            try:
-                result = json.loads(json_text)
-                return {
-                    "pass": bool(result.get("pass", False)),
-                    "confidence": float(result.get("confidence", 0.0)),
-                    "reason": str(result.get("reason", "No reason provided")),
-                }
-            except (json.JSONDecodeError, KeyError, TypeError):
-                pass
+        text = _FENCE_RE.sub("", text.strip()).strip()
+
+        # Models usually answer with a bare JSON object; parse that in one go
+        # and only scan for an embedded object when it fails.
+        try:
+            result = _loads(text)
+        except ValueError:
+            result = None
+        if isinstance(result, dict):
+            verdict = _verdict(result)
+            if verdict is not None:
+                return verdict
+        else:
+            # Only an opening brace followed by a quoted key can start the
+            # answer object; braces in prose never reach the decoder.
+            for match in _OBJECT_START_RE.finditer(text):
+                try:
+                    result, _ = _JSON_DECODER.raw_decode(text, match.start())
+                except json.JSONDecodeError:
+                    continue
+
+                verdict = _verdict(result)
+                if verdict is None:
+                    break
+                return verdict
 
         text_lower = text.lower()
         if "pass" in text_lower and "true" in text_lower:
@@ -285,47 +704,525 @@ class GeminiValidator:
         return {"pass": False, "confidence": 0.0, "reason": f"Cannot parse VLM response: {text[:200]}"}
 
 
-def main(argv: Optional[list[str]] = None) -> int:
-    parser = argparse.ArgumentParser(description="Gemini VLM image validator (up to 3 images)")
-    parser.add_argument("--image", type=Path, action="append", required=True, help="Image path to validate. Provide 1-3 times.")
-    parser.add_argument("--expected", type=str, required=True, help="Expected description or question for the images.")
-    parser.add_argument("--model", type=str, default=None, help="Override Gemini model name")
-    parser.add_argument("--confidence", type=float, default=GeminiValidator.DEFAULT_CONFIDENCE_THRESHOLD, help="Confidence threshold for warning message")
-    parser.add_argument("--temperature", type=float, default=GeminiValidator.DEFAULT_TEMPERATURE, help="Generation temperature (default: 0.0)")
-    parser.add_argument("--top-p", dest="top_p", type=float, default=GeminiValidator.DEFAULT_TOP_P, help="Generation top_p (default: 0.0)")
-    args = parser.parse_args(argv)
-
-    if len(args.image) > 3:
-        print(json.dumps({"success": False, "message": f"Maximum 3 images supported (got {len(args.image)})."}, ensure_ascii=False))
-        return 2
+USAGE = """usage: gemini_vlm.py --image PATH [--image PATH ...] --expected TEXT [options]
+       gemini_vlm.py --batch FILE [options]
+       gemini_vlm.py --serve [--socket PATH | --stdio]
+
+Gemini VLM image validator (up to 3 images)
+
+options:
+  --image PATH         Image path to validate. Provide 1-3 times.
+  --expected TEXT      Expected description or question for the images.
+  --batch FILE         JSON file with [{"images": [...], "expected": ...}] to validate via the Gemini Batch API
+  --model NAME         Override Gemini model name
+  --confidence FLOAT   Confidence threshold for warning message
+  --temperature FLOAT  Generation temperature (default: 0.0)
+  --top-p FLOAT        Generation top_p (default: 0.0)
+  --serve              Run as a sidecar on a Unix socket (--socket or $FLOW_VLM_SOCKET)
+  --socket PATH        Socket path for --serve
+  --stdio              With --serve, read one JSON request per line on stdin (raw
+                       image bytes may follow it) and write one JSON response per
+                       line on stdout instead
+
+When $FLOW_VLM_SOCKET points at a running sidecar, requests are sent to it
+instead of being validated in-process.
+"""
+
+_VALUE_OPTIONS = {
+    "--image": ("image", Path),
+    "--expected": ("expected", str),
+    "--batch": ("batch", Path),
+    "--model": ("model", str),
+    "--confidence": ("confidence", float),
+    "--temperature": ("temperature", float),
+    "--top-p": ("top_p", float),
+    "--socket": ("socket", str),
+}
+
+
+class _Args:
+    def __init__(self) -> None:
+        self.help = False
+        self.image: list[Path] = []
+        self.expected: Optional[str] = None
+        self.batch: Optional[Path] = None
+        self.model: Optional[str] = None
+        self.confidence = GeminiValidator.DEFAULT_CONFIDENCE_THRESHOLD
+        self.temperature = GeminiValidator.DEFAULT_TEMPERATURE
+        self.top_p = GeminiValidator.DEFAULT_TOP_P
+        self.serve = False
+        self.stdio = False
+        self.socket: Optional[str] = None
+
 
+def parse_args(argv: Sequence[str]) -> _Args:
+    """Walk argv by hand; argparse costs more to import than this script needs."""
+    args = _Args()
+    i = 0
+
+    while i < len(argv):
+        arg = argv[i]
+        value: Optional[str] = None
+        if arg.startswith("--") and "=" in arg:
+            arg, value = arg.split("=", 1)
+
+        if arg in ("-h", "--help"):
+            args.help = True
+        elif arg == "--serve":
+            args.serve = True
+        elif arg == "--stdio":
+            args.stdio = True
+        elif arg in _VALUE_OPTIONS:
+            if value is None:
+                if i + 1 >= len(argv):
+                    raise ValueError(f"argument {arg}: expected one argument")
+                i += 1
+                value = argv[i]
+            name, convert = _VALUE_OPTIONS[arg]
+            try:
+                converted = convert(value)
+            except ValueError:
+                raise ValueError(f"argument {arg}: invalid {convert.__name__} value: {value!r}") from None
+            if name == "image":
+                args.image.append(converted)
+            else:
+                setattr(args, name, converted)
+        else:
+            raise ValueError(f"unrecognized arguments: {argv[i]}")
+
+        i += 1
+
+    return args
+
+
+def _usage_error(message: str) -> int:
+    sys.stderr.write(USAGE.split("\n\n", 1)[0] + "\n")
+    sys.stderr.write(f"gemini_vlm.py: error: {message}\n")
+    return 2
+
+
+def main(argv: Optional[list[str]] = None) -> int:
     try:
-        api_key = load_api_key()
-        validator = GeminiValidator(
-            api_key=api_key,
-            model_name=args.model,
-            confidence_threshold=args.confidence,
-            temperature=args.temperature,
-            top_p=args.top_p,
-        )
-        result = validator.validate_screenshot_files(args.image, args.expected)
-    except Exception as e:
-        print(json.dumps({"success": False, "message": str(e)}, ensure_ascii=False))
-        return 2
+        args = parse_args(sys.argv[1:] if argv is None else argv)
+    except ValueError as e:
+        return _usage_error(str(e))
+
+    if args.help:
+        sys.stdout.write(USAGE)
+        return 0
+
+    if args.serve:
+        if args.stdio:
+            return run_stdio_server()
+        socket_path = args.socket or os.environ.get(VLM_SOCKET_ENV)
+        if not socket_path:
+            return _usage_error(f"--serve requires --socket or ${VLM_SOCKET_ENV}")
+        return run_server(Path(socket_path))
+
+    if args.batch is not None:
+        try:
+            with open(args.batch, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except Exception as e:
+            return _emit({"success": False, "message": str(e)}, 2)
+        if not isinstance(entries, list):
+            return _usage_error(f"--batch file {args.batch} must contain a JSON list")
+        items = []
+        for position, entry in enumerate(entries):
+            images = entry.get("images", []) if isinstance(entry, dict) else None
+            if not isinstance(images, list):
+                return _usage_error(
+                    f"--batch entry {position} must be an object with an \"images\" list: {entry!r}"
+                )
+            items.append({
+                "images": [str(path) for path in images],
+                "expected": str(entry.get("expected", "")),
+            })
+        request = {"op": "batch", "items": items}
+    elif not args.image or args.expected is None:
+        return _usage_error("--image and --expected are required unless --batch is given")
+    else:
+        request = {
+            "op": "validate",
+            "images": [str(path) for path in args.image],
+            "expected": args.expected,
+        }
+
+    request.update(
+        cwd=os.getcwd(),
+        model=args.model,
+        confidence=args.confidence,
+        temperature=args.temperature,
+        top_p=args.top_p,
+    )
+
+    response = _request_from_server(request)
+    if response is not None:
+        return _emit(response["payload"], response["exit_code"])
+    return _emit(*_handle_request(request, _new_validator))
+
+
+def _dumps(obj) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False)
 
-    payload = {
+
+def _emit(payload: dict, exit_code: int) -> int:
+    print(_dumps(payload))
+    return exit_code
+
+
+def _new_validator(model: Optional[str], confidence: float, temperature: float, top_p: float) -> GeminiValidator:
+    return GeminiValidator(
+        api_key=load_api_key(),
+        model_name=model,
+        confidence_threshold=confidence,
+        temperature=temperature,
+        top_p=top_p,
+    )
+
+
+def _result_payload(result: VLMValidationResult, images: Sequence) -> dict:
+    # Inline images arrive as {"len": N} placeholders; only file paths are
+    # echoed back, with the count covering both kinds.
+    return {
         "success": result.passed,
         "confidence": result.confidence,
         "reason": result.reason,
         "warning": result.warning,
+        "images": [image for image in images if isinstance(image, str)],
+        "image_count": len(images),
+    }
+
+
+def _handle_request(request: dict, get_validator, blobs: Optional[list[bytes]] = None) -> tuple[dict, int]:
+    """Run one validate/multi/batch request and return (payload, exit_code).
+
+    When blobs is given, the images of a validate request (or of every
+    item of a multi request, in order) are those raw bytes, sent inline
+    over the stdio worker pipe, rather than file paths. A multi request
+    validates its items concurrently with one shared client; batch submits
+    them as a Gemini Batch job.
+    """
+    op = request.get("op", "validate")
+    if op == "validate" and len(request.get("images", [])) > 3:
+        return {"success": False, "message": f"Maximum 3 images supported (got {len(request['images'])})."}, 2
+
+    base_dir = Path(request.get("cwd") or ".")
+    try:
+        validator = get_validator(
+            request.get("model"),
+            request.get("confidence", GeminiValidator.DEFAULT_CONFIDENCE_THRESHOLD),
+            request.get("temperature", GeminiValidator.DEFAULT_TEMPERATURE),
+            request.get("top_p", GeminiValidator.DEFAULT_TOP_P),
+        )
+        if op == "batch":
+            items = [
+                ([str(path) for path in item.get("images", [])], str(item.get("expected", "")))
+                for item in request.get("items", [])
+            ]
+            results = validator.validate_screenshot_files_batch(
+                [([base_dir / path for path in paths], expected) for paths, expected in items]
+            )
+        elif op == "multi":
+            items = [
+                (item.get("images", []), str(item.get("expected", "")))
+                for item in request.get("items", [])
+            ]
+            results = _validate_items(validator, items, base_dir, blobs)
+        elif op == "validate" and blobs is not None:
+            result = validator.validate_image_bytes(blobs, str(request.get("expected", "")))
+        elif op == "validate":
+            result = validator.validate_screenshot_files(
+                [base_dir / path for path in request.get("images", [])],
+                str(request.get("expected", "")),
+            )
+        else:
+            raise ValueError(f"Unknown request op: {op}")
+    except Exception as e:
+        return {"success": False, "message": str(e)}, 2
+
+    settings = {
         "model": validator.model_name,
         "temperature": validator.temperature,
         "top_p": validator.top_p,
-        "images": [str(path) for path in args.image],
     }
-    print(json.dumps(payload, ensure_ascii=False))
-    return 0 if result.passed else 1
+    if op in ("batch", "multi"):
+        passed = all(result.passed for result in results)
+        payload = {
+            "success": passed,
+            **settings,
+            "results": [
+                _result_payload(result, paths)
+                for result, (paths, _) in zip(results, items)
+            ],
+        }
+        return payload, 0 if passed else 1
+
+    payload = _result_payload(result, request.get("images", []))
+    payload.update(settings)
+    return payload, 0 if result.passed else 1
+
+
+def _validate_items(
+    validator: GeminiValidator,
+    items: Sequence[tuple[list, str]],
+    base_dir: Path,
+    blobs: Optional[list[bytes]],
+) -> list[VLMValidationResult]:
+    """Validate (images, expected) items side by side, in input order."""
+    results: list[Optional[VLMValidationResult]] = [None] * len(items)
+    calls = []
+    offset = 0
+    for index, (images, expected) in enumerate(items):
+        if len(images) > 3:
+            results[index] = VLMValidationResult(False, 0.0, f"Maximum 3 screenshots supported (got {len(images)}).")
+        elif blobs is not None:
+            calls.append((index, validator.validate_image_bytes, blobs[offset:offset + len(images)], expected))
+        else:
+            paths = [base_dir / path for path in images]
+            calls.append((index, validator.validate_screenshot_files, paths, expected))
+        offset += len(images)
+
+    def run(call) -> None:
+        index, validate, images, expected = call
+        results[index] = validate(images, expected)
+
+    if len(calls) <= 1:
+        for call in calls:
+            run(call)
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(calls), _STDIO_WORKERS)) as pool:
+            list(pool.map(run, calls))
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Sidecar mode: a long-lived process keeps warm GeminiValidator instances
+# (imports, genai.Client, HTTP connections) behind a Unix socket. Frames are
+# a 4-byte big-endian length followed by a UTF-8 JSON document.
+# ---------------------------------------------------------------------------
+
+VLM_SOCKET_ENV = "FLOW_VLM_SOCKET"
+_FRAME_HEADER = struct.Struct(">I")
+_CLIENT_TIMEOUT = 300.0
+
+
+def _send_frame(sock: socket.socket, message: dict) -> None:
+    data = _dumps(message).encode("utf-8")
+    sock.sendall(_FRAME_HEADER.pack(len(data)) + data)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            return None
+        received += count
+    return bytes(buffer)
+
+
+def _recv_frame(sock: socket.socket) -> Optional[dict]:
+    header = _recv_exact(sock, _FRAME_HEADER.size)
+    if header is None:
+        return None
+    (length,) = _FRAME_HEADER.unpack(header)
+    data = _recv_exact(sock, length)
+    if data is None:
+        return None
+    return _loads(data)
+
+
+def _request_from_server(request: dict) -> Optional[dict]:
+    """Round-trip a request through the sidecar, or return None to run in-process."""
+    socket_path = os.environ.get(VLM_SOCKET_ENV)
+    if not socket_path or not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(_CLIENT_TIMEOUT)
+            sock.connect(socket_path)
+            _send_frame(sock, request)
+            response = _recv_frame(sock)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(response, dict) or "payload" not in response:
+        return None
+    return response
+
+
+def _validator_cache():
+    """get_validator for servers: one warm GeminiValidator per settings tuple."""
+    validators: dict[tuple, GeminiValidator] = {}
+    validators_lock = threading.Lock()
+
+    def get_validator(model, confidence, temperature, top_p) -> GeminiValidator:
+        key = (model, confidence, temperature, top_p)
+        with validators_lock:
+            validator = validators.get(key)
+            if validator is None:
+                validator = validators[key] = _new_validator(model, confidence, temperature, top_p)
+            return validator
+
+    return get_validator
+
+
+def run_server(socket_path: Path) -> int:
+    if not hasattr(socket, "AF_UNIX"):
+        return _emit({"success": False, "message": "Unix sockets are not supported on this platform."}, 2)
+
+    get_validator = _validator_cache()
+
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self) -> None:
+            while True:
+                try:
+                    request = _recv_frame(self.request)
+                except (OSError, ValueError):
+                    return
+                if request is None:
+                    return
+                payload, exit_code = _handle_request(request, get_validator)
+                try:
+                    _send_frame(self.request, {"payload": payload, "exit_code": exit_code})
+                except OSError:
+                    return
+
+    if socket_path.exists():
+        socket_path.unlink()
+    with socketserver.ThreadingUnixStreamServer(str(socket_path), Handler) as server:
+        server.daemon_threads = True
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            try:
+                socket_path.unlink()
+            except OSError:
+                pass
+    return 0
+
+
+# Requests a --stdio worker handles at once; matches the e2e AssertionEngine.
+_STDIO_WORKERS = 8
+
+
+def run_stdio_server() -> int:
+    """Serve line-delimited JSON requests on stdin until EOF or {"op": "quit"}.
+
+    Each request may carry an "id", echoed in its response line as
+    {"id", "payload", "exit_code"}. A validate request whose "images" are
+    {"len": N} objects is followed on stdin by those images' raw bytes,
+    back to back, so no temp files are needed; a multi request does the
+    same for the images of all its items, in order. Requests run concurrently
+    and responses can arrive out of order. Anything else printed goes to
+    stderr to keep stdout clean for responses.
+    """
+    stdin = sys.stdin.buffer
+    out = sys.stdout
+    sys.stdout = sys.stderr
+    get_validator = _validator_cache()
+    write_lock = threading.Lock()
+    # The client is usually started ahead of its first request, so import
+    # the SDK now rather than on that request's critical path.
+    threading.Thread(target=_preload_sdk, name="flow-vlm-preload", daemon=True).start()
+
+    def send(request: dict, payload: dict, exit_code: int) -> None:
+        line = _dumps({"id": request.get("id"), "payload": payload, "exit_code": exit_code})
+        with write_lock:
+            out.write(line + "\n")
+            out.flush()
+
+    def respond(request: dict, blobs: Optional[list[bytes]]) -> None:
+        send(request, *_handle_request(request, get_validator, blobs))
+
+    with ThreadPoolExecutor(max_workers=_STDIO_WORKERS) as pool:
+        for line in stdin:
+            if not line.strip():
+                continue
+            try:
+                request = _loads(line)
+            except ValueError:
+                continue
+            if not isinstance(request, dict):
+                continue
+            if request.get("op") == "quit":
+                break
+
+            try:
+                sizes = _inline_image_sizes(request)
+            except ValueError as e:
+                # Nothing is read for a malformed request; answer it and
+                # carry on with the next line.
+                send(request, {"success": False, "message": str(e)}, 2)
+                continue
+            blobs = _read_inline_images(stdin, sizes)
+            if blobs is _TRUNCATED:
+                break
+            pool.submit(respond, request, blobs)
+    return 0
+
+
+def _preload_sdk() -> None:
+    try:
+        _lazy_import("genai")
+        _lazy_import("types")
+    except Exception:
+        pass  # Reported by the first request that needs the SDK.
+
+
+# Returned by _read_inline_images when stdin ends inside an image.
+_TRUNCATED: list[bytes] = []
+
+
+def _inline_image_sizes(request: dict) -> Optional[list[int]]:
+    """Byte lengths of the inline images following request, or None for paths.
+
+    Images are inline when every entry is a {"len": N} object; a multi
+    request's entries are taken across its items, in order.
+
+    Raises:
+        ValueError: If an item or a length is malformed, so the number of
+            bytes to read cannot be trusted.
+    """
+    if request.get("op") == "multi":
+        items = request.get("items") or []
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            raise ValueError("multi request items must be objects.")
+        images = [image for item in items for image in (item.get("images") or [])]
+    else:
+        images = request.get("images") or []
+    if not isinstance(images, list) or not images or not all(isinstance(image, dict) for image in images):
+        return None
+
+    sizes: list[int] = []
+    for image in images:
+        size = image.get("len")
+        if type(size) is not int or size < 0:
+            raise ValueError(f"Invalid inline image length: {size!r}")
+        sizes.append(size)
+    return sizes
+
 
+def _read_inline_images(stream, sizes: Optional[list[int]]) -> Optional[list[bytes]]:
+    """Read the raw image bytes of the given sizes, back to back, if any."""
+    if sizes is None:
+        return None
+    blobs: list[bytes] = []
+    for size in sizes:
+        blob = stream.read(size)
+        if len(blob) != size:
+            return _TRUNCATED
+        blobs.append(blob)
+    return blobs
 
 if __name__ == "__main__":
     raise SystemExit(main())
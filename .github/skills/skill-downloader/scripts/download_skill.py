@@ -4,14 +4,16 @@
 from __future__ import annotations
 
 import argparse
+import itertools
 import os
 import re
 import shutil
 import sys
+import tarfile
 import tempfile
 import urllib.parse
 import urllib.request
-import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 
 def is_url(value: str) -> bool:
@@ -30,33 +32,90 @@ def ensure_unique_path(path: str, force: bool) -> str:
             os.remove(path)
         return path
 
-    if not os.path.exists(path):
+    dirname, basename = os.path.split(path)
+    try:
+        with os.scandir(dirname or ".") as entries:
+            existing = {entry.name for entry in entries}
+    except OSError:
+        existing = None
+
+    if existing is None:
+        if not os.path.exists(path):
+            return path
+        base, ext = os.path.splitext(path)
+        for counter in itertools.count(1):
+            candidate = f"{base}-{counter}{ext}"
+            if not os.path.exists(candidate):
+                return candidate
+
+    # The listing rules out exact matches without a stat each; the chosen
+    # name is still confirmed with os.path.exists, which also catches
+    # case-only collisions on case-insensitive filesystems (Windows, macOS).
+    if basename not in existing and not os.path.exists(path):
         return path
 
-    base, ext = os.path.splitext(path)
-    counter = 1
-    while True:
-        candidate = f"{base}-{counter}{ext}"
-        if not os.path.exists(candidate):
-            return candidate
-        counter += 1
+    stem, ext = os.path.splitext(basename)
+    for counter in itertools.count(1):
+        candidate = f"{stem}-{counter}{ext}"
+        if candidate not in existing:
+            candidate_path = os.path.join(dirname, candidate)
+            if not os.path.exists(candidate_path):
+                return candidate_path
+
+
+COPY_BUFFER_SIZE = 1024 * 1024
 
 
 def download_to_file(url: str, dest_path: str) -> None:
     os.makedirs(os.path.dirname(dest_path), exist_ok=True)
     with urllib.request.urlopen(url) as response:
         with open(dest_path, "wb") as handle:
-            shutil.copyfileobj(response, handle)
+            shutil.copyfileobj(response, handle, length=COPY_BUFFER_SIZE)
+
+
+COPY_WORKERS = 8
 
 
 def copy_path(src_path: str, dest_path: str) -> str:
     if os.path.isdir(src_path):
-        shutil.copytree(src_path, dest_path)
+        copy_tree_threaded(src_path, dest_path)
         return dest_path
     shutil.copy2(src_path, dest_path)
     return dest_path
 
 
+def copy_tree_threaded(src_dir: str, dest_dir: str) -> None:
+    # Like shutil.copytree, refuse to merge into an existing destination.
+    os.makedirs(dest_dir)
+    # Build the directory skeleton first so file copies can run in any order.
+    copies = []
+    for root, _, files in os.walk(src_dir, followlinks=True):
+        target_root = os.path.join(dest_dir, os.path.relpath(root, src_dir))
+        os.makedirs(target_root, exist_ok=True)
+        for filename in files:
+            copies.append((os.path.join(root, filename), os.path.join(target_root, filename)))
+
+    if copies:
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+            for future in [pool.submit(shutil.copy2, src, dest) for src, dest in copies]:
+                future.result()
+
+    for root, _, _ in os.walk(src_dir, followlinks=True):
+        shutil.copystat(root, os.path.join(dest_dir, os.path.relpath(root, src_dir)))
+
+
+def move_path(src_path: str, dest_path: str) -> str:
+    # os.rename would silently replace an existing file on POSIX.
+    if os.path.lexists(dest_path):
+        raise FileExistsError(f"Destination already exists: {dest_path}")
+    # Temporary downloads usually share a filesystem with the output dir.
+    try:
+        os.rename(src_path, dest_path)
+        return dest_path
+    except OSError:
+        return copy_path(src_path, dest_path)
+
+
 def parse_github_url(url: str) -> dict | None:
     parsed = urllib.parse.urlparse(url)
     if parsed.netloc.lower() != "github.com":
@@ -101,14 +160,15 @@ def parse_github_raw_url(url: str) -> dict | None:
     }
 
 
-def extract_zip(zip_path: str, dest_dir: str) -> str:
-    with zipfile.ZipFile(zip_path, "r") as archive:
-        archive.extractall(dest_dir)
-        top_levels = {
-            name.split("/")[0]
-            for name in archive.namelist()
-            if name and "/" in name
-        }
+def extract_tarball(fileobj, dest_dir: str) -> str:
+    """Extract a gzip tar stream member by member, as it arrives."""
+    extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+    top_levels = set()
+
+    with tarfile.open(fileobj=fileobj, mode="r|gz") as archive:
+        for member in archive:
+            top_levels.add(member.name.split("/")[0])
+            archive.extract(member, dest_dir, **extract_kwargs)
 
     if len(top_levels) == 1:
         return os.path.join(dest_dir, next(iter(top_levels)))
@@ -117,7 +177,7 @@ def extract_zip(zip_path: str, dest_dir: str) -> str:
     return dest_dir
 
 
-def resolve_zip_root_path(root_dir: str, subpath: str) -> str:
+def resolve_archive_root_path(root_dir: str, subpath: str) -> str:
     if not subpath:
         return root_dir
 
@@ -135,12 +195,11 @@ def download_github_repo(owner: str, repo: str, ref: str, subpath: str) -> str:
     if not ref:
         ref = "main"
 
-    zip_url = f"https://github.com/{owner}/{repo}/archive/refs/heads/{ref}.zip"
+    tar_url = f"https://codeload.github.com/{owner}/{repo}/tar.gz/{ref}"
     temp_dir = tempfile.mkdtemp(prefix="skill_download_")
-    zip_path = os.path.join(temp_dir, f"{repo}-{ref}.zip")
-    download_to_file(zip_url, zip_path)
-    root_dir = extract_zip(zip_path, temp_dir)
-    target_path = resolve_zip_root_path(root_dir, subpath)
+    with urllib.request.urlopen(tar_url) as response:
+        root_dir = extract_tarball(response, temp_dir)
+    target_path = resolve_archive_root_path(root_dir, subpath)
 
     if not os.path.exists(target_path):
         raise FileNotFoundError(f"Subpath not found in repo: {subpath}")
@@ -168,7 +227,7 @@ def handle_url(source: str, output_dir: str, name: str | None, force: bool, ref:
         )
         base_name = name or os.path.basename(os.path.normpath(temp_target)) or github["repo"]
         dest_path = ensure_unique_path(os.path.join(output_dir, base_name), force)
-        return copy_path(temp_target, dest_path)
+        return move_path(temp_target, dest_path)
 
     if github_raw:
         filename = name or os.path.basename(github_raw["subpath"]) or "downloaded_file"
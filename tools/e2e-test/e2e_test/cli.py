@@ -4,18 +4,21 @@ Invoked by flow-cli's PythonBridge:
     python -m e2e_test.cli <scenario_file_or_dir> [options]
 """
 
-import json
+import logging
 import sys
 import time
 from pathlib import Path
 from typing import Optional
 
+from .utils.json_compat import dumps
+
 # Don't require click for the basic CLI - keep it dependency-light
 # click is available for future advanced CLI needs
 
 
 def main():
     """Main CLI entry point."""
+    _configure_logging()
     args = parse_args(sys.argv[1:])
 
     if args.get("help"):
@@ -38,6 +41,18 @@ def main():
         _run_single_file(target, args)
 
 
+def _configure_logging() -> None:
+    """Show discovery progress on stdout as plain messages, as the CLI always has."""
+    discovery_logger = logging.getLogger("e2e_test.discovery")
+    if any(isinstance(h, logging.StreamHandler) for h in discovery_logger.handlers):
+        return
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    discovery_logger.addHandler(handler)
+    discovery_logger.setLevel(logging.INFO)
+    discovery_logger.propagate = False
+
+
 def _run_single_file(scenario_file: Path, args: dict) -> None:
     """Run a single YAML scenario file."""
     # Parse and validate scenario
@@ -70,6 +85,7 @@ def _run_single_file(scenario_file: Path, args: dict) -> None:
             discovery_timeout=args.get("timeout", 300) / 10,  # 10% of total for discovery
             test_timeout=args.get("timeout", 300),
             save_report=args.get("save_report", False),
+            batch_vlm=args.get("batch_vlm", False),
         )
 
         if args.get("report_dir"):
@@ -108,7 +124,7 @@ def _run_single_file(scenario_file: Path, args: dict) -> None:
 
         # Output as flow-compatible JSON
         flow_output = result.to_flow_json()
-        print(json.dumps(flow_output, ensure_ascii=False))
+        print(dumps(flow_output))
 
         if not flow_output.get("success", False):
             sys.exit(1)
@@ -188,6 +204,7 @@ def _run_directory(scenario_dir: Path, args: dict) -> None:
                 discovery_timeout=args.get("timeout", 300) / 10,
                 test_timeout=args.get("timeout", 300),
                 save_report=args.get("save_report", False),
+                batch_vlm=args.get("batch_vlm", False),
             )
             if args.get("report_dir"):
                 config.report_dir = Path(args["report_dir"])
@@ -260,7 +277,7 @@ def _run_directory(scenario_dir: Path, args: dict) -> None:
         },
         "message": message,
     }
-    print(json.dumps(output, ensure_ascii=False))
+    print(dumps(output))
 
     if not all_success:
         sys.exit(1)
@@ -292,6 +309,8 @@ def parse_args(argv: list[str]) -> dict:
             args["report_dir"] = argv[i]
         elif arg == "--pretty":
             args["pretty"] = True
+        elif arg == "--batch-vlm":
+            args["batch_vlm"] = True
         elif not arg.startswith("-"):
             if "scenario" not in args:
                 args["scenario"] = arg
@@ -309,7 +328,7 @@ def output_error(message: str, **extra):
         "data": extra or None,
         "message": message,
     }
-    print(json.dumps(output, ensure_ascii=False))
+    print(dumps(output))
 
 
 def print_help():
@@ -330,6 +349,7 @@ Options:
     --save-report       Save report to file
     --report-dir <dir>  Directory for saved reports
     --pretty            Pretty print output
+    --batch-vlm         Validate screenshots in one Gemini Batch job (slower, cheaper)
     -h, --help          Show this help
 """)
 
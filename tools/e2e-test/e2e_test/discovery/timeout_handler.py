@@ -1,5 +1,6 @@
 """Timeout handling utilities for discovery and transport."""
 
+import random
 import time
 from dataclasses import dataclass
 from typing import Callable, Optional, TypeVar
@@ -7,13 +8,14 @@ from typing import Callable, Optional, TypeVar
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetryConfig:
     """Configuration for retry logic."""
     max_retries: int = 3
     initial_delay: float = 1.0
     backoff_factor: float = 2.0
     max_delay: float = 30.0
+    jitter: float = 0.5  # Fraction of each delay that is randomized; 0 disables
 
 
 class TimeoutHandler:
@@ -29,31 +31,40 @@ class TimeoutHandler:
         self.timeout = timeout
         self.retry_config = retry_config or RetryConfig()
         self._start_time: Optional[float] = None
+        self._deadline: Optional[float] = None
 
     @property
     def elapsed(self) -> float:
         """Seconds elapsed since start."""
         if self._start_time is None:
             return 0.0
-        return time.time() - self._start_time
+        return time.monotonic() - self._start_time
 
     @property
     def remaining(self) -> float:
         """Seconds remaining before timeout."""
-        return max(0.0, self.timeout - self.elapsed)
+        if self._deadline is None:
+            return self.timeout
+        return max(0.0, self._deadline - time.monotonic())
 
     @property
     def is_expired(self) -> bool:
         """Whether the timeout has expired."""
-        return self.elapsed >= self.timeout
+        return self._deadline is not None and time.monotonic() >= self._deadline
 
     def start(self) -> None:
         """Start the timeout timer."""
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
+        self._deadline = self._start_time + self.timeout
 
     def reset(self) -> None:
         """Reset the timeout timer."""
-        self._start_time = time.time()
+        self.start()
+
+    def _jittered(self, delay: float) -> float:
+        """Randomize part of a backoff delay so concurrent retries spread out."""
+        jitter = min(max(self.retry_config.jitter, 0.0), 1.0)
+        return delay * (1.0 - jitter) + random.random() * delay * jitter
 
     def execute_with_retry(
         self,
@@ -90,7 +101,9 @@ class TimeoutHandler:
                         on_retry(attempt + 1, e)
 
                     # Wait with backoff, but respect overall timeout
-                    wait_time = min(delay, self.remaining)
+                    if self.remaining <= 0:
+                        break
+                    wait_time = min(self._jittered(delay), self.remaining)
                     if wait_time > 0:
                         time.sleep(wait_time)
                     delay = min(
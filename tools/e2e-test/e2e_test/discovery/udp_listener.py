@@ -5,12 +5,25 @@ Target apps broadcast their connection info (app name, HTTP port, platform)
 on UDP port 51320.
 """
 
-import json
+import asyncio
+import logging
+import selectors
 import socket
 import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Iterator, Optional
 
+from ..utils.json_compat import loads
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+# Discovery progress is logged at INFO; the CLI sends it to stdout, library
+# users get whatever their own logging configuration does with it.
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 # Default UDP discovery port (fixed)
 DEFAULT_DISCOVERY_PORT = 51320
@@ -18,8 +31,14 @@ DEFAULT_DISCOVERY_PORT = 51320
 # Default listen timeout in seconds
 DEFAULT_TIMEOUT = 30
 
+# Largest broadcast payload accepted (bytes)
+MAX_DATAGRAM_SIZE = 4096
+
+# Requested kernel receive buffer for the discovery socket (bytes)
+RECEIVE_BUFFER_SIZE = 2 * 1024 * 1024
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class AppInfo:
     """Information about a discovered E2E test target app."""
     app: str
@@ -39,6 +58,38 @@ class AppInfo:
         return f"{self.app}{platform_str} at {self.base_url}"
 
 
+if msgspec is not None:
+    class _BroadcastMessage(msgspec.Struct):
+        """Broadcast payload decoded by msgspec.
+
+        Only the port is typed; the other fields are as loose as the plain
+        JSON path and go through the same coercion in _make_app_info.
+        """
+        app: Any
+        port: int
+        platform: Any = None
+        version: Any = None
+
+    _BROADCAST_DECODER = msgspec.json.Decoder(_BroadcastMessage)
+else:
+    _BROADCAST_DECODER = None
+
+
+def _make_app_info(
+    app: Any, host: str, port: Any, platform: Any, version: Any
+) -> Optional[AppInfo]:
+    """Build AppInfo from decoded broadcast fields, or None if app/port are missing."""
+    if not app or not isinstance(port, int):
+        return None
+    return AppInfo(
+        app=str(app),
+        host=host,
+        port=port,
+        platform=None if platform is None else str(platform),
+        version=None if version is None else str(version),
+    )
+
+
 class UDPListener:
     """Listens for UDP broadcast messages from E2E target apps.
 
@@ -59,15 +110,61 @@ class UDPListener:
         """
         self.port = port
         self._sock: Optional[socket.socket] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._rxbuf = bytearray(MAX_DATAGRAM_SIZE)
+        self._rxview = memoryview(self._rxbuf)
 
-    def _create_socket(self) -> socket.socket:
-        """Create and configure the UDP socket."""
+    def _bind_socket(self) -> socket.socket:
+        """Create a non-blocking UDP socket bound to the discovery port."""
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            except OSError:
+                pass
+        try:
+            # Room for bursts from several targets without kernel drops.
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECEIVE_BUFFER_SIZE)
+        except OSError:
+            pass
         sock.bind(("", self.port))
-        sock.settimeout(1.0)  # 1-second polling interval
+        sock.setblocking(False)
+        return sock
+
+    def _create_socket(self) -> socket.socket:
+        """Create and configure the UDP socket."""
+        sock = self._bind_socket()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(sock, selectors.EVENT_READ)
         return sock
 
+    def _datagrams(self, deadline: float) -> Iterator[tuple[memoryview, str]]:
+        """Yield datagrams as they arrive until the monotonic deadline.
+
+        Each readiness event drains everything already queued on the socket
+        before waiting again. Datagrams are read into a buffer reused across
+        iterations, so a yielded view is only valid until the next one.
+
+        Args:
+            deadline: time.monotonic() value after which to stop.
+
+        Yields:
+            (payload view, sender host) tuples.
+        """
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if not self._selector.select(remaining):
+                continue
+            while True:
+                try:
+                    nbytes, addr = self._sock.recvfrom_into(self._rxbuf)
+                except (BlockingIOError, InterruptedError):
+                    break
+                yield self._rxview[:nbytes], addr[0]
+
     def listen(
         self,
         timeout: float = DEFAULT_TIMEOUT,
@@ -89,32 +186,28 @@ class UDPListener:
             OSError: If socket binding fails.
         """
         self._sock = self._create_socket()
-        start_time = time.time()
+        start_time = time.monotonic()
+        deadline = start_time + timeout
 
         try:
-            print(f"Listening for E2E target app on UDP port {self.port}...")
-
-            while time.time() - start_time < timeout:
-                try:
-                    data, addr = self._sock.recvfrom(4096)
-                    app_info = self._parse_broadcast(data, addr[0])
+            logger.info("Listening for E2E target app on UDP port %d...", self.port)
 
-                    if app_info is None:
-                        continue
+            for data, host in self._datagrams(deadline):
+                app_info = self._parse_broadcast(data, host)
 
-                    # Apply filters
-                    if app_filter and app_info.app != app_filter:
-                        continue
-                    if platform_filter and app_info.platform != platform_filter:
-                        continue
-
-                    print(f"Discovered: {app_info}")
-                    return app_info
+                if app_info is None:
+                    continue
 
-                except socket.timeout:
+                # Apply filters
+                if app_filter and app_info.app != app_filter:
+                    continue
+                if platform_filter and app_info.platform != platform_filter:
                     continue
 
-            elapsed = time.time() - start_time
+                logger.info("Discovered: %s", app_info)
+                return app_info
+
+            elapsed = time.monotonic() - start_time
             raise TimeoutError(
                 f"No target app found after {elapsed:.1f}s on UDP port {self.port}. "
                 "Make sure the app is running with E2E_TESTS=true."
@@ -122,6 +215,54 @@ class UDPListener:
         finally:
             self.close()
 
+    async def listen_async(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        app_filter: Optional[str] = None,
+        platform_filter: Optional[str] = None,
+    ) -> AppInfo:
+        """Asynchronously listen for a target app's UDP broadcast.
+
+        Runs on the current event loop instead of blocking a thread, so
+        discovery can be awaited alongside other work or cancelled.
+
+        Args:
+            timeout: Maximum time to wait in seconds. Default: 30.
+            app_filter: Only accept apps matching this name.
+            platform_filter: Only accept apps matching this platform.
+
+        Returns:
+            AppInfo for the discovered app.
+
+        Raises:
+            TimeoutError: If no matching app is found within timeout.
+            OSError: If socket binding fails.
+        """
+        loop = asyncio.get_running_loop()
+        found: asyncio.Future[AppInfo] = loop.create_future()
+        start_time = time.monotonic()
+
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _DiscoveryProtocol(self, found, app_filter, platform_filter),
+            sock=self._bind_socket(),
+        )
+
+        try:
+            logger.info("Listening for E2E target app on UDP port %d...", self.port)
+            try:
+                app_info = await asyncio.wait_for(found, timeout)
+            except TimeoutError:
+                elapsed = time.monotonic() - start_time
+                raise TimeoutError(
+                    f"No target app found after {elapsed:.1f}s on UDP port {self.port}. "
+                    "Make sure the app is running with E2E_TESTS=true."
+                ) from None
+
+            logger.info("Discovered: %s", app_info)
+            return app_info
+        finally:
+            transport.close()
+
     def listen_all(
         self,
         timeout: float = DEFAULT_TIMEOUT,
@@ -137,37 +278,32 @@ class UDPListener:
             List of discovered AppInfo objects (deduplicated by host:port).
         """
         self._sock = self._create_socket()
-        start_time = time.time()
-        discovered: dict[str, AppInfo] = {}
+        deadline = time.monotonic() + timeout
+        discovered: dict[tuple[str, int], AppInfo] = {}
 
         try:
-            print(f"Scanning for E2E target apps on UDP port {self.port} ({timeout}s)...")
-
-            while time.time() - start_time < timeout:
-                try:
-                    data, addr = self._sock.recvfrom(4096)
-                    app_info = self._parse_broadcast(data, addr[0])
+            logger.info("Scanning for E2E target apps on UDP port %d (%ss)...", self.port, timeout)
 
-                    if app_info is None:
-                        continue
+            for data, host in self._datagrams(deadline):
+                app_info = self._parse_broadcast(data, host)
 
-                    if app_filter and app_info.app != app_filter:
-                        continue
-
-                    key = f"{app_info.host}:{app_info.port}"
-                    if key not in discovered:
-                        discovered[key] = app_info
-                        print(f"  Found: {app_info}")
+                if app_info is None:
+                    continue
 
-                except socket.timeout:
+                if app_filter and app_info.app != app_filter:
                     continue
 
+                key = (app_info.host, app_info.port)
+                if key not in discovered:
+                    discovered[key] = app_info
+                    logger.info("  Found: %s", app_info)
+
         finally:
             self.close()
 
         return list(discovered.values())
 
-    def _parse_broadcast(self, data: bytes, host: str) -> Optional[AppInfo]:
+    def _parse_broadcast(self, data: bytes | memoryview, host: str) -> Optional[AppInfo]:
         """Parse a UDP broadcast message into AppInfo.
 
         Expected JSON format:
@@ -178,31 +314,40 @@ class UDPListener:
             "version": "1.0.0"
         }
         """
+        if _BROADCAST_DECODER is not None:
+            try:
+                broadcast = _BROADCAST_DECODER.decode(data)
+            except msgspec.DecodeError:
+                return None
+            return _make_app_info(
+                broadcast.app,
+                host,
+                broadcast.port,
+                broadcast.platform,
+                broadcast.version,
+            )
+
         try:
-            message = json.loads(data.decode("utf-8"))
-        except (json.JSONDecodeError, UnicodeDecodeError):
+            message = loads(data)
+        except ValueError:
             return None
 
         if not isinstance(message, dict):
             return None
 
-        # Required fields
-        app = message.get("app")
-        port = message.get("port")
-
-        if not app or not isinstance(port, int):
-            return None
-
-        return AppInfo(
-            app=str(app),
-            host=host,
-            port=port,
-            platform=message.get("platform"),
-            version=message.get("version"),
+        return _make_app_info(
+            message.get("app"),
+            host,
+            message.get("port"),
+            message.get("platform"),
+            message.get("version"),
         )
 
     def close(self) -> None:
         """Close the UDP socket."""
+        if self._selector:
+            self._selector.close()
+            self._selector = None
         if self._sock:
             try:
                 self._sock.close()
@@ -215,3 +360,37 @@ class UDPListener:
 
     def __exit__(self, *args):
         self.close()
+
+
+class _DiscoveryProtocol(asyncio.DatagramProtocol):
+    """Resolves a future with the first broadcast that passes the filters."""
+
+    def __init__(
+        self,
+        listener: UDPListener,
+        found: "asyncio.Future[AppInfo]",
+        app_filter: Optional[str],
+        platform_filter: Optional[str],
+    ):
+        self._listener = listener
+        self._found = found
+        self._app_filter = app_filter
+        self._platform_filter = platform_filter
+
+    def datagram_received(self, data: bytes, addr: tuple) -> None:
+        if self._found.done():
+            return
+
+        app_info = self._listener._parse_broadcast(data, addr[0])
+        if app_info is None:
+            return
+        if self._app_filter and app_info.app != self._app_filter:
+            return
+        if self._platform_filter and app_info.platform != self._platform_filter:
+            return
+
+        self._found.set_result(app_info)
+
+    def error_received(self, exc: Exception) -> None:
+        # ICMP errors on a listen-only socket are not fatal; keep waiting.
+        pass
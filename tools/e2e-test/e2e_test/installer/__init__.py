@@ -1,6 +1,17 @@
 """Installer module - Python environment management."""
 
-from .python_checker import find_python, check_python_version
+from .python_checker import (
+    check_python_version,
+    clear_probe_cache,
+    find_python,
+    probe_python_version,
+)
 from .venv_manager import VenvManager
 
-__all__ = ["find_python", "check_python_version", "VenvManager"]
+__all__ = [
+    "find_python",
+    "check_python_version",
+    "probe_python_version",
+    "clear_probe_cache",
+    "VenvManager",
+]
@@ -3,10 +3,12 @@
 Finds and validates Python 3.12.x installation.
 """
 
+import functools
 import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -20,38 +22,87 @@ WINDOWS_INSTALL_CMD = (
 )
 
 
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+_VERSION_SNIPPET = "import sys; print('Python %d.%d.%d' % tuple(sys.version_info[:3]))"
+
+
 def _parse_version(version_string: str) -> Optional[Tuple[int, int, int]]:
     """Parse 'Python X.Y.Z' into (major, minor, patch) tuple."""
-    match = re.search(r"(\d+)\.(\d+)\.(\d+)", version_string)
+    match = _VERSION_RE.search(version_string)
     if match:
         return int(match.group(1)), int(match.group(2)), int(match.group(3))
     return None
 
 
-def _try_python_command(cmd: str) -> Optional[Tuple[str, str, Tuple[int, int, int]]]:
-    """Try running a python command and return (cmd, version_str, version_tuple) or None."""
+class _ProbeFailed(Exception):
+    """Raised inside the probe cache so failures are never memoized."""
+
+
+def probe_python_version(cmd: str, mtime: Optional[float] = None) -> Optional[str]:
+    """Ask `cmd` for its version and return 'Python X.Y.Z', or None if it cannot run.
+
+    The interpreter runs in isolated mode (-I) so site-packages are not
+    imported just to print a version, and a non-zero exit (e.g. a pyenv shim
+    for a version that is not active) counts as not found.
+
+    Successful results are memoized per (cmd, mtime); pass the executable's
+    mtime when probing a concrete path so a replaced interpreter is probed
+    again. Failures are not memoized, so an interpreter installed later in
+    the same process is still found.
+    """
+    try:
+        return _probe_python_version_cached(cmd, mtime)
+    except _ProbeFailed:
+        return None
+
+
+def clear_probe_cache() -> None:
+    """Forget memoized interpreter versions (e.g. after removing a venv)."""
+    _probe_python_version_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=8)
+def _probe_python_version_cached(cmd: str, mtime: Optional[float]) -> str:
     try:
         result = subprocess.run(
-            [cmd, "--version"],
+            [cmd, "-I", "-c", _VERSION_SNIPPET],
             capture_output=True,
             text=True,
             timeout=10,
         )
-        output = result.stdout.strip() or result.stderr.strip()
+    except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+        raise _ProbeFailed(cmd) from None
+    output = result.stdout.strip() if result.returncode == 0 else ""
+    if not output:
+        raise _ProbeFailed(cmd)
+    return output
+
+
+def _try_python_command(cmd: str) -> Optional[Tuple[str, str, Tuple[int, int, int]]]:
+    """Try running a python command and return (cmd, version_str, version_tuple) or None."""
+    output = probe_python_version(cmd)
+    if output:
         version_tuple = _parse_version(output)
         if version_tuple:
             return cmd, output, version_tuple
-    except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
-        pass
     return None
 
 
+def _same_file(a: str, b: str) -> bool:
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return False
+
+
 def find_python() -> Tuple[Optional[str], Optional[str]]:
     """Find a Python 3.12.x executable on the system.
 
     Searches in order:
-    1. FLOW_PYTHON_PATH environment variable
-    2. Common Python command names (python, python3, python3.12)
+    1. The running interpreter, if it is 3.12 and FLOW_PYTHON_PATH is unset
+       or points at it
+    2. FLOW_PYTHON_PATH environment variable
+    3. Common Python command names (python, python3, python3.12)
 
     Returns:
         Tuple of (python_executable, version_string) or (None, None) if not found.
@@ -60,6 +111,13 @@ def find_python() -> Tuple[Optional[str], Optional[str]]:
 
     # Check environment variable first
     env_python = os.environ.get("FLOW_PYTHON_PATH")
+
+    # The running interpreter already satisfies the requirement: skip spawning
+    # any probes unless FLOW_PYTHON_PATH points somewhere else.
+    if sys.version_info[:2] == (REQUIRED_MAJOR, REQUIRED_MINOR) and sys.executable:
+        if not env_python or _same_file(env_python, sys.executable):
+            return sys.executable, "Python %d.%d.%d" % tuple(sys.version_info[:3])
+
     if env_python:
         candidates.append(env_python)
 
@@ -69,16 +127,23 @@ def find_python() -> Tuple[Optional[str], Optional[str]]:
     else:  # Unix/macOS
         candidates.extend(["python3.12", "python3", "python"])
 
-    for cmd in candidates:
-        result = _try_python_command(cmd)
-        if result is None:
-            continue
-
-        cmd, version_str, version_tuple = result
-        major, minor, _ = version_tuple
-
-        if major == REQUIRED_MAJOR and minor == REQUIRED_MINOR:
-            return cmd, version_str
+    # Probe every candidate concurrently, but accept results in priority order
+    # so FLOW_PYTHON_PATH still wins over the generic command names.
+    executor = ThreadPoolExecutor(max_workers=len(candidates))
+    try:
+        futures = [executor.submit(_try_python_command, cmd) for cmd in candidates]
+        for future in futures:
+            result = future.result()
+            if result is None:
+                continue
+
+            cmd, version_str, version_tuple = result
+            major, minor, _ = version_tuple
+
+            if major == REQUIRED_MAJOR and minor == REQUIRED_MINOR:
+                return cmd, version_str
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
     return None, None
 
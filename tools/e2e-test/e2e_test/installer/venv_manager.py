@@ -11,7 +11,28 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-from .python_checker import check_python_version
+from ..utils.fs import ensure_dir
+from .python_checker import (
+    REQUIRED_MAJOR,
+    REQUIRED_MINOR,
+    check_python_version,
+    clear_probe_cache,
+    probe_python_version,
+)
+
+_REQUIRED_VERSION_PREFIX = f"Python {REQUIRED_MAJOR}.{REQUIRED_MINOR}."
+
+# Prints installed distributions in the same shape as `pip list --format=json`.
+_LIST_DISTRIBUTIONS_SNIPPET = (
+    "import json, sys\n"
+    "from importlib.metadata import distributions\n"
+    "seen = {}\n"
+    "for d in distributions():\n"
+    "    name = d.metadata['Name']\n"
+    "    if name and name.lower() not in seen:\n"
+    "        seen[name.lower()] = {'name': name, 'version': d.version}\n"
+    "json.dump(list(seen.values()), sys.stdout)\n"
+)
 
 
 class VenvManager:
@@ -19,6 +40,7 @@ class VenvManager:
 
     DEFAULT_VENV_DIR = ".venv"
     FLOW_HOME_DIR = ".flow"
+    PIP_CACHE_DIR = ".pip-cache"
 
     def __init__(self, venv_path: Optional[Path] = None):
         """Initialize VenvManager.
@@ -53,21 +75,14 @@ class VenvManager:
 
     def is_valid(self) -> bool:
         """Check if venv is valid and has correct Python version."""
-        if not self.python_exe.exists():
-            return False
-
         try:
-            result = subprocess.run(
-                [str(self.python_exe), "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            output = result.stdout.strip() or result.stderr.strip()
-            return "3.12." in output
-        except (subprocess.TimeoutExpired, OSError):
+            mtime = self.python_exe.stat().st_mtime
+        except OSError:
             return False
 
+        output = probe_python_version(str(self.python_exe), mtime)
+        return output is not None and output.startswith(_REQUIRED_VERSION_PREFIX)
+
     def create(self, force: bool = False) -> bool:
         """Create a new virtual environment.
 
@@ -84,19 +99,21 @@ class VenvManager:
             if force:
                 print(f"Removing existing venv at {self.venv_path}...")
                 shutil.rmtree(self.venv_path)
+                clear_probe_cache()
             elif self.is_valid():
                 print(f"Valid venv already exists at {self.venv_path}")
                 return True
             else:
                 print(f"Invalid venv at {self.venv_path}, recreating...")
                 shutil.rmtree(self.venv_path)
+                clear_probe_cache()
 
         python_exe, version = check_python_version()
         print(f"Using {version}")
         print(f"Creating venv at {self.venv_path}...")
 
         # Ensure parent directory exists
-        self.venv_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.venv_path.parent)
 
         try:
             subprocess.run(
@@ -157,27 +174,56 @@ class VenvManager:
 
         print(f"Installing dependencies from {requirements_file}...")
 
+        # Keep downloaded wheels across venv rebuilds.
+        env = dict(os.environ)
+        env.setdefault("PIP_CACHE_DIR", str(Path.home() / self.FLOW_HOME_DIR / self.PIP_CACHE_DIR))
+        env["PIP_DISABLE_PIP_VERSION_CHECK"] = "1"
+
+        # Progress output is never shown, so send it to DEVNULL and keep
+        # only stderr for the error message.
+        run_kwargs = dict(
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            env=env,
+        )
         try:
-            # Upgrade pip first
-            subprocess.run(
-                [str(self.python_exe), "-m", "pip", "install", "--upgrade", "pip"],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-
-            # Install requirements
-            subprocess.run(
-                [
-                    str(self.pip_exe),
-                    "install",
-                    "-r",
-                    str(requirements_file),
-                ],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+            uv = shutil.which("uv")
+            if uv:
+                # uv resolves and installs into the venv without needing pip.
+                subprocess.run(
+                    [
+                        uv,
+                        "pip",
+                        "install",
+                        "--quiet",
+                        "--python",
+                        str(self.python_exe),
+                        "-r",
+                        str(requirements_file),
+                    ],
+                    **run_kwargs,
+                )
+            else:
+                # Upgrade pip first
+                subprocess.run(
+                    [str(self.python_exe), "-m", "pip", "--quiet", "install", "--upgrade", "pip"],
+                    **run_kwargs,
+                )
+
+                # Install requirements, preferring wheels over building sdists
+                subprocess.run(
+                    [
+                        str(self.pip_exe),
+                        "--quiet",
+                        "install",
+                        "--prefer-binary",
+                        "-r",
+                        str(requirements_file),
+                    ],
+                    **run_kwargs,
+                )
         except subprocess.CalledProcessError as e:
             raise RuntimeError(
                 f"Failed to install dependencies: {e.stderr or e.stdout}"
@@ -214,19 +260,27 @@ class VenvManager:
         if not self.is_valid():
             return {}
 
-        try:
-            result = subprocess.run(
-                [str(self.pip_exe), "list", "--format=json"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            if result.returncode == 0:
-                import json
-                packages = json.loads(result.stdout)
-                return {pkg["name"]: pkg["version"] for pkg in packages}
-        except (subprocess.TimeoutExpired, OSError, Exception):
-            pass
+        import json
+
+        # Read dist-info metadata directly instead of importing all of pip;
+        # fall back to `pip list` if the one-liner fails for any reason.
+        commands = [
+            [str(self.python_exe), "-I", "-c", _LIST_DISTRIBUTIONS_SNIPPET],
+            [str(self.pip_exe), "list", "--format=json"],
+        ]
+        for cmd in commands:
+            try:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                )
+                if result.returncode == 0:
+                    packages = json.loads(result.stdout)
+                    return {pkg["name"]: pkg["version"] for pkg in packages}
+            except (subprocess.TimeoutExpired, OSError, Exception):
+                pass
 
         return {}
 
@@ -3,14 +3,56 @@
 Generates structured JSON reports from test execution results.
 """
 
-import json
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 from typing import Any, Optional
 
+from ..utils.fs import ensure_dir
+from ..utils.json_compat import dumps, dumps_bytes
 from ..validators.assertion_engine import AssertionReport
 
 
+def _iso_utc_now() -> str:
+    """Current UTC time formatted like datetime.now(timezone.utc).isoformat()."""
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    t = time.gmtime(seconds)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{nanos // 1000:06d}+00:00"
+    )
+
+
+def _tally(results: list[Any]) -> tuple[list[str], dict[str, int]]:
+    """Classify assertion results in one pass.
+
+    Returns:
+        Tuple of (per-result "pass"/"fail"/"skip" status, summary counts).
+    """
+    statuses = []
+    counts = {"passed": 0, "failed": 0, "skipped": 0}
+    for r in results:
+        if r.skipped:
+            counts["skipped"] += 1
+            statuses.append("skip")
+        elif r.passed:
+            counts["passed"] += 1
+            statuses.append("pass")
+        else:
+            counts["failed"] += 1
+            statuses.append("fail")
+    return statuses, counts
+
+
+def _summary(
+    counts: dict[str, int], duration_ms: int, error: Optional[str]
+) -> tuple[str, dict[str, Any]]:
+    """Overall report status and the "summary" block for tallied counts."""
+    total = sum(counts.values())
+    all_passed = counts["failed"] == 0 if total else (error is None)
+    summary = {"total": total, **counts, "duration_ms": duration_ms}
+    return ("passed" if all_passed else "failed"), summary
+
+
 class JsonReporter:
     """Generates JSON reports from E2E test results."""
 
@@ -20,7 +62,7 @@ class JsonReporter:
         platform: str,
         assertion_report: AssertionReport,
         duration_ms: int = 0,
-        logs: Optional[list[dict]] = None,
+        logs: Optional[list[Any]] = None,
         screenshots_saved: Optional[list[str]] = None,
         error: Optional[str] = None,
     ) -> dict[str, Any]:
@@ -31,38 +73,36 @@ class JsonReporter:
             platform: Target platform (unity/flutter).
             assertion_report: Results of assertion evaluation.
             duration_ms: Test duration in milliseconds.
-            logs: Test execution logs.
+            logs: Test execution logs, as dicts or dataclass entries
+                (e.g. transport LogEntry). Entries are stored as-is and only
+                converted when the report is serialized.
             screenshots_saved: List of saved screenshot paths.
             error: Overall error message if test failed.
 
         Returns:
             Report dictionary ready for JSON serialization.
         """
-        all_passed = assertion_report.all_passed if assertion_report.results else (error is None)
+        statuses, counts = _tally(assertion_report.results)
+        assertions = []
+        for r, status in zip(assertion_report.results, statuses):
+            vlm_result = r.vlm_result
+            assertions.append({
+                "name": r.assertion.name,
+                "type": r.assertion.type,
+                "status": status,
+                "confidence": vlm_result.confidence if vlm_result else None,
+                "reason": r.details,
+                "warning": vlm_result.warning if vlm_result else None,
+            })
+        status, summary = _summary(counts, duration_ms, error)
 
         report = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _iso_utc_now(),
             "scenario": scenario_name,
             "platform": platform,
-            "status": "passed" if all_passed else "failed",
-            "summary": {
-                "total": assertion_report.total_count,
-                "passed": assertion_report.passed_count,
-                "failed": assertion_report.failed_count,
-                "skipped": assertion_report.skipped_count,
-                "duration_ms": duration_ms,
-            },
-            "assertions": [
-                {
-                    "name": r.assertion.name,
-                    "type": r.assertion.type,
-                    "status": "skip" if r.skipped else ("pass" if r.passed else "fail"),
-                    "confidence": r.vlm_result.confidence if r.vlm_result else None,
-                    "reason": r.details,
-                    "warning": r.vlm_result.warning if r.vlm_result else None,
-                }
-                for r in assertion_report.results
-            ],
+            "status": status,
+            "summary": summary,
+            "assertions": assertions,
             "logs": logs or [],
             "screenshots": screenshots_saved or [],
             "error": error,
@@ -70,6 +110,36 @@ class JsonReporter:
 
         return report
 
+    def generate_summary(
+        self,
+        scenario_name: str,
+        assertion_report: AssertionReport,
+        duration_ms: int = 0,
+        error: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Generate only the report fields that generate_flow_output reads.
+
+        Skips the per-assertion entries, logs, screenshots and timestamp that
+        generate() builds, for callers that only need the flow output.
+
+        Args:
+            scenario_name: Name of the test scenario.
+            assertion_report: Results of assertion evaluation.
+            duration_ms: Test duration in milliseconds.
+            error: Overall error message if test failed.
+
+        Returns:
+            Dictionary with "scenario", "status", "summary" and "error".
+        """
+        _, counts = _tally(assertion_report.results)
+        status, summary = _summary(counts, duration_ms, error)
+        return {
+            "scenario": scenario_name,
+            "status": status,
+            "summary": summary,
+            "error": error,
+        }
+
     def save(self, report: dict[str, Any], path: Path) -> Path:
         """Save report to a JSON file.
 
@@ -81,11 +151,8 @@ class JsonReporter:
             Path to the saved file.
         """
         path = Path(path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
-
+        ensure_dir(path.parent)
+        path.write_bytes(dumps_bytes(report, pretty=True))
         return path
 
     def to_json_string(self, report: dict[str, Any], pretty: bool = True) -> str:
@@ -98,9 +165,7 @@ class JsonReporter:
         Returns:
             JSON string.
         """
-        if pretty:
-            return json.dumps(report, indent=2, ensure_ascii=False)
-        return json.dumps(report, ensure_ascii=False)
+        return dumps(report, pretty=pretty)
 
     def generate_flow_output(
         self,
@@ -10,19 +10,47 @@ Coordinates the full test flow:
 7. Generate report
 """
 
+import asyncio
+import sys
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Final, Iterator, Optional
 
 from ..discovery.udp_listener import AppInfo, UDPListener
 from ..reporting.json_reporter import JsonReporter
 from ..scenario.schema import Scenario
-from ..transport.http_client import E2EHttpClient, TestResult as HttpTestResult
+from ..transport import async_http_client
+from ..transport.async_http_client import AsyncE2EHttpClient
+from ..transport.http_client import (
+    E2EHttpClient,
+    LogEntry,
+    TestResult as HttpTestResult,
+)
 from ..validators.assertion_engine import AssertionEngine, AssertionReport
 from ..validators.gemini_vlm import GeminiValidator
 
 
+def _describe_error(e: Exception) -> str:
+    """Format an execution error for ExecutionResult.error."""
+    if isinstance(e, TimeoutError):
+        return f"Timeout: {e}"
+    if isinstance(e, ConnectionError):
+        return f"Connection failed: {e}"
+    if isinstance(e, RuntimeError):
+        return f"{e}"
+    return f"Unexpected error: {type(e).__name__}: {e}"
+
+
+# JsonReporter holds no state, so one instance serves every execution.
+_REPORTER = JsonReporter()
+
+# Stand-in for results that failed before any assertion ran. Shared, so it
+# must never be mutated.
+_EMPTY_REPORT: Final[AssertionReport] = AssertionReport()
+
+
 @dataclass
 class ExecutionConfig:
     """Configuration for test execution."""
@@ -32,6 +60,7 @@ class ExecutionConfig:
     save_report: bool = False
     report_dir: Optional[Path] = None
     pretty_output: bool = True
+    batch_vlm: bool = False  # validate screenshots in one Gemini Batch job
 
 
 @dataclass
@@ -42,24 +71,28 @@ class ExecutionResult:
     all_passed: bool = False
     assertion_report: Optional[AssertionReport] = None
     duration_ms: int = 0
-    logs: list[dict] = field(default_factory=list)
+    logs: list[LogEntry] = field(default_factory=list)
     screenshots_saved: list[str] = field(default_factory=list)
     error: Optional[str] = None
     report_path: Optional[str] = None
+    # Full report generated by TestExecutor._save_report, reused here.
+    _report: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_flow_json(self) -> dict:
         """Convert to flow CLI compatible JSON output."""
-        reporter = JsonReporter()
-        report = reporter.generate(
-            scenario_name=self.scenario_name,
-            platform=self.platform,
-            assertion_report=self.assertion_report or AssertionReport(),
-            duration_ms=self.duration_ms,
-            logs=self.logs,
-            screenshots_saved=self.screenshots_saved,
-            error=self.error,
-        )
-        return reporter.generate_flow_output(report, self.report_path)
+        report = self._report
+        if report is None:
+            # The flow output only needs the summary, so skip building the
+            # full report (assertion entries, logs, screenshots).
+            report = _REPORTER.generate_summary(
+                scenario_name=self.scenario_name,
+                assertion_report=self.assertion_report or _EMPTY_REPORT,
+                duration_ms=self.duration_ms,
+                error=self.error,
+            )
+        return _REPORTER.generate_flow_output(report, self.report_path)
 
 
 class TestExecutor:
@@ -88,7 +121,10 @@ class TestExecutor:
         self.config = config or ExecutionConfig()
         self.gemini_validator = gemini_validator
         self.app_info = app_info
-        self._reporter = JsonReporter()
+        # Last progress shown, so unchanged poll ticks print nothing.
+        self._last_progress: Optional[tuple[int, int]] = None
+        # True while an in-place (\r) progress line is left unterminated.
+        self._progress_open = False
 
     def execute(self) -> ExecutionResult:
         """Execute the full test flow.
@@ -96,78 +132,146 @@ class TestExecutor:
         Returns:
             ExecutionResult with all test outcomes.
         """
-        start_time = time.time()
-        result = ExecutionResult(
-            scenario_name=self.scenario.meta.app,
-            platform=self.scenario.meta.platform,
-        )
+        result = self._new_result()
+        self._warm_up_validator()
 
-        try:
+        with self._recording(result):
             # Step 1: Discover target app
             app_info = self._discover_app()
             print(f"Connected to: {app_info}")
 
-            # Step 2: Set up HTTP client
-            with E2EHttpClient(app_info.base_url) as client:
-                # Step 3: Submit scenario
-                print(f"Submitting scenario: {self.scenario.meta.app}")
-                session = client.post_run(self.scenario.to_dict())
-                print(f"Session started: {session.session_id}")
+            self._run_session(app_info, result)
 
-                # Step 4: Poll until complete and get results
-                print("Waiting for test completion...")
-                http_result = client.poll_until_complete(
-                    session.session_id,
-                    timeout=self.config.test_timeout,
-                    poll_interval=self.config.poll_interval,
-                    on_progress=self._on_progress,
-                )
+        return self._finish(result)
+
+    async def execute_async(self) -> ExecutionResult:
+        """Execute the full test flow without blocking the event loop.
+
+        UDP discovery runs on the event loop while the scenario payload is
+        serialized in a worker thread. With httpx installed the HTTP session
+        is driven by AsyncE2EHttpClient on the loop as well; otherwise it
+        runs in a worker thread. VLM validation always runs in a worker
+        thread. Several executors (one per device) can therefore be awaited
+        together with ``asyncio.gather``.
 
-            # Step 5: Collect logs
-            result.logs = [
-                {
-                    "timestamp": log.timestamp,
-                    "level": log.level,
-                    "message": log.message,
-                }
-                for log in http_result.logs
-            ]
-
-            # Step 6: Validate with VLM
-            screenshots_dict = {
-                ss.name: ss.data for ss in http_result.screenshots
-            }
-
-            assertion_engine = AssertionEngine(self.gemini_validator)
-            assertion_report = assertion_engine.evaluate(
-                self.scenario.assertions, screenshots_dict
+        Returns:
+            ExecutionResult with all test outcomes.
+        """
+        result = self._new_result()
+        self._warm_up_validator()
+
+        with self._recording(result):
+            # Step 1: Discover target app (payload is built meanwhile)
+            app_info, _ = await asyncio.gather(
+                self._discover_app_async(),
+                asyncio.to_thread(self.scenario.to_dict),
             )
+            print(f"Connected to: {app_info}")
 
-            result.assertion_report = assertion_report
-            result.all_passed = assertion_report.all_passed
+            if async_http_client.httpx is not None:
+                http_result = await self._run_http_async(app_info)
+                await asyncio.to_thread(self._evaluate, http_result, result)
+            else:
+                await asyncio.to_thread(self._run_session, app_info, result)
 
-            # Step 7: Report
-            self._print_assertion_summary(assertion_report)
+        return await asyncio.to_thread(self._finish, result)
 
-        except TimeoutError as e:
-            result.error = f"Timeout: {str(e)}"
-            print(f"ERROR: {result.error}")
+    def _new_result(self) -> ExecutionResult:
+        return ExecutionResult(
+            scenario_name=self.scenario.meta.app,
+            platform=self.scenario.meta.platform,
+        )
 
-        except ConnectionError as e:
-            result.error = f"Connection failed: {str(e)}"
-            print(f"ERROR: {result.error}")
+    def _warm_up_validator(self) -> None:
+        """Start the VLM worker while the device runs, if it will be needed."""
+        if self.gemini_validator is not None and any(
+            assertion.type == "screenshot" for assertion in self.scenario.assertions
+        ):
+            self.gemini_validator.warm_up()
 
-        except RuntimeError as e:
-            result.error = str(e)
-            print(f"ERROR: {result.error}")
+    @contextmanager
+    def _recording(self, result: ExecutionResult) -> Iterator[None]:
+        """Record errors raised by the test flow on result, and its duration."""
+        start_time = time.time()
+        try:
+            yield
 
         except Exception as e:
-            result.error = f"Unexpected error: {type(e).__name__}: {str(e)}"
+            result.error = _describe_error(e)
             print(f"ERROR: {result.error}")
 
         finally:
             result.duration_ms = int((time.time() - start_time) * 1000)
 
+    def _run_session(self, app_info: AppInfo, result: ExecutionResult) -> None:
+        """Steps 2-7: submit, poll, collect and validate against app_info."""
+        self._evaluate(self._run_http(app_info), result)
+
+    def _run_http(self, app_info: AppInfo) -> HttpTestResult:
+        """Steps 2-4: submit the scenario and wait for its result."""
+        # Step 2: Set up HTTP client
+        with E2EHttpClient(app_info.base_url) as client:
+            # Step 3: Submit scenario
+            print(f"Submitting scenario: {self.scenario.meta.app}")
+            session = client.post_run(self.scenario.to_dict())
+            print(f"Session started: {session.session_id}")
+
+            # Step 4: Poll until complete and get results
+            print("Waiting for test completion...")
+            self._last_progress = None
+            try:
+                return client.poll_until_complete(
+                    session.session_id,
+                    timeout=self.config.test_timeout,
+                    poll_interval=self.config.poll_interval,
+                    on_progress=self._on_progress,
+                )
+            finally:
+                self._end_progress()
+
+    async def _run_http_async(self, app_info: AppInfo) -> HttpTestResult:
+        """Steps 2-4 on the event loop, with AsyncE2EHttpClient."""
+        async with AsyncE2EHttpClient(app_info.base_url) as client:
+            print(f"Submitting scenario: {self.scenario.meta.app}")
+            session = await client.post_run(self.scenario.to_dict())
+            print(f"Session started: {session.session_id}")
+
+            print("Waiting for test completion...")
+            self._last_progress = None
+            try:
+                return await client.poll_until_complete(
+                    session.session_id,
+                    timeout=self.config.test_timeout,
+                    poll_interval=self.config.poll_interval,
+                    on_progress=self._on_progress,
+                )
+            finally:
+                self._end_progress()
+
+    def _evaluate(self, http_result: HttpTestResult, result: ExecutionResult) -> None:
+        """Steps 5-7: collect logs, validate screenshots and print the summary."""
+        # Step 5: Collect logs (serialized only when the report is written)
+        result.logs = http_result.logs
+
+        # Step 6: Validate with VLM
+        screenshots_dict = {
+            ss.name: ss.content for ss in http_result.screenshots
+        }
+
+        assertion_engine = AssertionEngine(
+            self.gemini_validator, batch_vlm=self.config.batch_vlm
+        )
+        assertion_report = assertion_engine.evaluate(
+            self.scenario.assertions, screenshots_dict
+        )
+
+        result.assertion_report = assertion_report
+        result.all_passed = assertion_report.all_passed
+
+        # Step 7: Report
+        self._print_assertion_summary(assertion_report)
+
+    def _finish(self, result: ExecutionResult) -> ExecutionResult:
         # Save report if configured
         if self.config.save_report:
             result.report_path = self._save_report(result)
@@ -185,11 +289,47 @@ class TestExecutor:
             platform_filter=self.scenario.meta.platform,
         )
 
+    async def _discover_app_async(self) -> AppInfo:
+        """Async counterpart of _discover_app."""
+        if self.app_info:
+            return self.app_info
+
+        listener = UDPListener()
+        return await listener.listen_async(
+            timeout=self.config.discovery_timeout,
+            platform_filter=self.scenario.meta.platform,
+        )
+
     def _on_progress(self, status) -> None:
-        """Callback for test progress updates."""
-        if status.total_steps > 0:
-            pct = int(status.progress * 100)
-            print(f"  Progress: {pct}% ({status.current_step}/{status.total_steps})")
+        """Callback for test progress updates.
+
+        Only prints when the percentage or step changes. On a terminal the
+        line is rewritten in place instead of scrolling.
+        """
+        if status.total_steps <= 0:
+            return
+
+        pct = int(status.progress * 100)
+        key = (pct, status.current_step)
+        if key == self._last_progress:
+            return
+        self._last_progress = key
+
+        line = f"  Progress: {pct}% ({status.current_step}/{status.total_steps})"
+        out = sys.stdout
+        if out.isatty():
+            out.write(f"\r{line}\x1b[K")
+            self._progress_open = True
+        else:
+            out.write(f"{line}\n")
+        out.flush()
+
+    def _end_progress(self) -> None:
+        """Terminate an in-place progress line, if one is open."""
+        if self._progress_open:
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+            self._progress_open = False
 
     def _print_assertion_summary(self, report: AssertionReport) -> None:
         """Print assertion results summary."""
@@ -204,17 +344,18 @@ class TestExecutor:
             report_dir = self.config.report_dir or Path(".")
             report_path = report_dir / f"e2e_report_{self.scenario.meta.app}.json"
 
-            report = self._reporter.generate(
+            report = _REPORTER.generate(
                 scenario_name=result.scenario_name,
                 platform=result.platform,
-                assertion_report=result.assertion_report or AssertionReport(),
+                assertion_report=result.assertion_report or _EMPTY_REPORT,
                 duration_ms=result.duration_ms,
                 logs=result.logs,
                 screenshots_saved=result.screenshots_saved,
                 error=result.error,
             )
 
-            saved_path = self._reporter.save(report, report_path)
+            result._report = report
+            saved_path = _REPORTER.save(report, report_path)
             print(f"Report saved: {saved_path}")
             return str(saved_path)
 
@@ -4,29 +4,61 @@ Collects and aggregates test results from multiple sources.
 """
 
 import base64
+import binascii
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from ..utils.fs import ensure_dir
 
-@dataclass
+# Upper bound on concurrent screenshot decode/write workers.
+SAVE_WORKERS = 8
+
+# Base64 characters decoded per write when streaming a screenshot to disk.
+# Must be a multiple of 4 so every chunk ends on a quantum boundary.
+DECODE_CHUNK_CHARS = 256 * 1024
+
+# Plain base64 with padding only at the end: the only text that can be
+# split on fixed 4-character boundaries.
+_CHUNKABLE_BASE64_RE = re.compile(r"[A-Za-z0-9+/]*={0,2}")
+
+
+@dataclass(slots=True)
 class CollectedScreenshot:
     """A collected screenshot with metadata."""
     name: str
     data: str  # base64 encoded
     saved_path: Optional[str] = None
+    source_path: Optional[str] = None  # already-decoded file on local disk
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectedResult:
     """Aggregated collection of test results."""
     screenshots: list[CollectedScreenshot] = field(default_factory=list)
     logs: list[dict] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
-
-    def add_screenshot(self, name: str, data: str) -> None:
-        """Add a screenshot to the collection."""
-        self.screenshots.append(CollectedScreenshot(name=name, data=data))
+    _by_name: dict[str, list[CollectedScreenshot]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def add_screenshot(
+        self, name: str, data: str, source_path: Optional[str] = None
+    ) -> CollectedScreenshot:
+        """Add a screenshot to the collection and return it."""
+        screenshot = CollectedScreenshot(
+            name=name, data=data, source_path=source_path
+        )
+        self.screenshots.append(screenshot)
+        self._by_name.setdefault(name, []).append(screenshot)
+        return screenshot
+
+    def get_screenshots(self, name: str) -> list[CollectedScreenshot]:
+        """Get every screenshot collected under a name, in arrival order."""
+        return self._by_name.get(name, [])
 
     def add_log(self, level: str, message: str, timestamp: str = "") -> None:
         """Add a log entry."""
@@ -68,16 +100,38 @@ class ResultCollector:
         """Collect screenshots from HTTP response.
 
         Args:
-            screenshots: List of {name, data} dicts from HTTP result.
+            screenshots: List of {name, data} dicts from HTTP result. An
+                entry may carry ``path`` instead of (or as well as) ``data``
+                when the image is already a file on local disk; it is then
+                copied without a base64 round trip.
         """
-        for ss in screenshots:
-            name = ss.get("name", "unnamed")
-            data = ss.get("data", "")
-            self.result.add_screenshot(name, data)
+        collected = [
+            self.result.add_screenshot(
+                ss.get("name", "unnamed"), ss.get("data", ""), ss.get("path")
+            )
+            for ss in screenshots
+        ]
+
+        # Save to disk if output_dir is configured. Decoding and writing
+        # are independent per screenshot, so overlap them in a pool.
+        if not self.output_dir or not collected:
+            return
+
+        try:
+            ensure_dir(self.output_dir)
+        except OSError as e:
+            self.result.add_error(
+                f"Failed to create screenshot directory '{self.output_dir}': {e}"
+            )
+            return
 
-            # Save to disk if output_dir is configured
-            if self.output_dir:
-                self._save_screenshot(name, data)
+        if len(collected) == 1:
+            self._save_screenshot(collected[0])
+            return
+
+        workers = min(SAVE_WORKERS, len(collected))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(self._save_screenshot, collected))
 
     def collect_logs(self, logs: list[dict]) -> None:
         """Collect log entries from HTTP response."""
@@ -88,28 +142,38 @@ class ResultCollector:
                 timestamp=log.get("timestamp", ""),
             )
 
-    def _save_screenshot(self, name: str, data: str) -> Optional[str]:
-        """Save a base64 screenshot to disk."""
+    def _save_screenshot(self, screenshot: CollectedScreenshot) -> Optional[str]:
+        """Save a screenshot to disk and record its path."""
+        name = screenshot.name
         try:
-            self.output_dir.mkdir(parents=True, exist_ok=True)
-            file_path = self.output_dir / f"{name}.png"
-            image_bytes = base64.b64decode(data)
-
-            with open(file_path, "wb") as f:
-                f.write(image_bytes)
-
-            # Update the screenshot's saved_path
-            for ss in self.result.screenshots:
-                if ss.name == name and ss.saved_path is None:
-                    ss.saved_path = str(file_path)
-                    break
-
-            return str(file_path)
+            file_path = self.output_dir / self._file_name(screenshot)
+            if screenshot.source_path:
+                # copyfile uses the kernel's zero-copy path (sendfile /
+                # copy_file_range) where the platform offers one.
+                shutil.copyfile(screenshot.source_path, file_path)
+            else:
+                _write_base64(file_path, screenshot.data)
+            screenshot.saved_path = str(file_path)
+            return screenshot.saved_path
 
         except Exception as e:
             self.result.add_error(f"Failed to save screenshot '{name}': {e}")
             return None
 
+    def _file_name(self, screenshot: CollectedScreenshot) -> str:
+        """File name for a screenshot; repeated names get a numeric suffix.
+
+        The first screenshot with a given name keeps ``<name>.png`` so that
+        unique names map to the same files as before.
+        """
+        same_name = self.result.get_screenshots(screenshot.name)
+        index = next(
+            (i for i, ss in enumerate(same_name) if ss is screenshot), 0
+        )
+        if index == 0:
+            return f"{screenshot.name}.png"
+        return f"{screenshot.name}_{index}.png"
+
     def get_saved_paths(self) -> list[str]:
         """Get list of saved screenshot file paths."""
         return [
@@ -117,3 +181,21 @@ class ResultCollector:
             for ss in self.result.screenshots
             if ss.saved_path is not None
         ]
+
+
+def _write_base64(file_path: Path, data: str) -> None:
+    """Decode base64 ``data`` into ``file_path``.
+
+    Large payloads are decoded chunk by chunk straight into the file, so
+    the full decoded image never has to sit in memory next to its
+    encoded form. Anything else (line breaks, stray whitespace or other
+    characters b64decode ignores) can't be split on fixed boundaries and
+    is decoded in one go.
+    """
+    if len(data) <= DECODE_CHUNK_CHARS or _CHUNKABLE_BASE64_RE.fullmatch(data) is None:
+        file_path.write_bytes(base64.b64decode(data))
+        return
+
+    with open(file_path, "wb") as f:
+        for start in range(0, len(data), DECODE_CHUNK_CHARS):
+            f.write(binascii.a2b_base64(data[start:start + DECODE_CHUNK_CHARS]))
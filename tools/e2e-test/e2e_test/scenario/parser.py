@@ -8,8 +8,18 @@ from typing import Union
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 from .schema import Assertion, Scenario, ScenarioMeta, Step
 
+# Keys accepted by each dataclass; anything else in the YAML is ignored.
+_META_FIELDS = frozenset(ScenarioMeta.__dataclass_fields__)
+_STEP_FIELDS = frozenset(Step.__dataclass_fields__)
+_ASSERTION_FIELDS = frozenset(Assertion.__dataclass_fields__)
+
 
 def parse_scenario(file_path: Union[str, Path]) -> Scenario:
     """Parse a YAML scenario file into a Scenario object.
@@ -33,7 +43,9 @@ def parse_scenario(file_path: Union[str, Path]) -> Scenario:
         raise ValueError(f"Expected .yaml or .yml file, got: {file_path.suffix}")
 
     with open(file_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        text = f.read()
+
+    data = yaml.load(text, Loader=_SafeLoader)
 
     if data is None:
         raise ValueError(f"Empty scenario file: {file_path}")
@@ -67,8 +79,7 @@ def parse_scenario_data(data: dict, source: str = "<inline>") -> Scenario:
 
     _require_fields(meta_data, ["app", "platform"], "meta", source)
     meta = ScenarioMeta(**{
-        k: v for k, v in meta_data.items()
-        if k in ScenarioMeta.__dataclass_fields__
+        k: meta_data[k] for k in _META_FIELDS & meta_data.keys()
     })
 
     # Parse steps
@@ -82,8 +93,7 @@ def parse_scenario_data(data: dict, source: str = "<inline>") -> Scenario:
             raise ValueError(f"Step {i} must be a mapping in {source}")
         _require_fields(step_data, ["type"], f"steps[{i}]", source)
         step = Step(**{
-            k: v for k, v in step_data.items()
-            if k in Step.__dataclass_fields__
+            k: step_data[k] for k in _STEP_FIELDS & step_data.keys()
         })
         steps.append(step)
 
@@ -98,8 +108,7 @@ def parse_scenario_data(data: dict, source: str = "<inline>") -> Scenario:
             raise ValueError(f"Assertion {i} must be a mapping in {source}")
         _require_fields(a_data, ["type", "name"], f"assert[{i}]", source)
         assertion = Assertion(**{
-            k: v for k, v in a_data.items()
-            if k in Assertion.__dataclass_fields__
+            k: a_data[k] for k in _ASSERTION_FIELDS & a_data.keys()
         })
         assertions.append(assertion)
 
@@ -3,7 +3,8 @@
 Defines dataclasses for parsing and representing YAML test scenarios.
 """
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from typing import Any, Optional
 
@@ -24,12 +25,22 @@ class AssertionType(str, Enum):
     ELEMENT = "element"
 
 
-VALID_STEP_TYPES = {e.value for e in StepType}
-VALID_ASSERTION_TYPES = {e.value for e in AssertionType}
-VALID_PLATFORMS = {"unity", "flutter"}
+VALID_STEP_TYPES = frozenset(e.value for e in StepType)
+VALID_ASSERTION_TYPES = frozenset(e.value for e in AssertionType)
+VALID_PLATFORMS = frozenset({"unity", "flutter"})
 
 
-@dataclass
+def _lower(value: str) -> str:
+    """Lowercase and intern ``value``.
+
+    Interned type/platform strings are identical objects to the enum
+    values (literals are interned at compile time), so the validator's
+    set lookups and equality checks succeed on the identity fast path.
+    """
+    return sys.intern(value if value.islower() else value.lower())
+
+
+@dataclass(slots=True)
 class ScenarioMeta:
     """Metadata for a test scenario."""
     app: str
@@ -39,10 +50,10 @@ class ScenarioMeta:
     description: str = ""
 
     def __post_init__(self):
-        self.platform = self.platform.lower()
+        self.platform = _lower(self.platform)
 
 
-@dataclass
+@dataclass(slots=True)
 class Step:
     """A single test step."""
     type: str
@@ -53,10 +64,10 @@ class Step:
     description: Optional[str] = None
 
     def __post_init__(self):
-        self.type = self.type.lower()
+        self.type = _lower(self.type)
 
 
-@dataclass
+@dataclass(slots=True)
 class Assertion:
     """A test assertion."""
     type: str
@@ -65,15 +76,36 @@ class Assertion:
     expected: Optional[str] = None
 
     def __post_init__(self):
-        self.type = self.type.lower()
+        self.type = _lower(self.type)
+
+
+# Field names in declaration order; slotted instances have no __dict__.
+_STEP_KEYS = tuple(f.name for f in fields(Step))
+_ASSERTION_KEYS = tuple(f.name for f in fields(Assertion))
 
 
-@dataclass
+def _non_null_fields(obj: Any, keys: tuple[str, ...]) -> dict[str, Any]:
+    """Map the given attribute names of obj to their values, skipping None."""
+    return {
+        k: v for k in keys if (v := getattr(obj, k)) is not None
+    }
+
+
+@dataclass(slots=True)
 class Scenario:
     """A complete E2E test scenario."""
     meta: ScenarioMeta
     steps: list[Step] = field(default_factory=list)
     assertions: list[Assertion] = field(default_factory=list)
+    _items_cache: Optional[tuple[list[dict[str, Any]], list[dict[str, Any]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Reassigning any field invalidates the cached serialized steps.
+        if name != "_items_cache":
+            object.__setattr__(self, "_items_cache", None)
+        object.__setattr__(self, name, value)
 
     @property
     def total_steps(self) -> int:
@@ -86,7 +118,22 @@ class Scenario:
         return len(self.assertions)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert scenario to dictionary for serialization."""
+        """Convert scenario to dictionary for serialization.
+
+        Every call returns a new top-level dict whose ``meta`` is read from
+        the scenario at that moment, so in-place edits such as
+        ``scenario.meta.platform = ...`` are always reflected. The ``steps``
+        and ``assert`` lists are built once and cached until a field of the
+        scenario is reassigned; in-place edits of ``steps``/``assertions``
+        are not tracked, so call ``invalidate()`` after making them, and
+        treat those lists as read-only.
+        """
+        if self._items_cache is None:
+            self._items_cache = (
+                [_non_null_fields(step, _STEP_KEYS) for step in self.steps],
+                [_non_null_fields(a, _ASSERTION_KEYS) for a in self.assertions],
+            )
+        steps, assertions = self._items_cache
         return {
             "meta": {
                 "app": self.meta.app,
@@ -95,18 +142,16 @@ class Scenario:
                 "timeout": self.meta.timeout,
                 "description": self.meta.description,
             },
-            "steps": [
-                {k: v for k, v in step.__dict__.items() if v is not None}
-                for step in self.steps
-            ],
-            "assert": [
-                {k: v for k, v in a.__dict__.items() if v is not None}
-                for a in self.assertions
-            ],
+            "steps": steps,
+            "assert": assertions,
         }
 
+    def invalidate(self) -> None:
+        """Drop the cached ``to_dict()`` steps and assertions."""
+        self._items_cache = None
+
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
     """A single validation error."""
     path: str
@@ -114,7 +159,7 @@ class ValidationError:
     severity: str = "error"  # "error" or "warning"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of scenario validation."""
     valid: bool
@@ -3,6 +3,9 @@
 Validates parsed Scenario objects against business rules.
 """
 
+import re
+from typing import Callable
+
 from .schema import (
     Assertion,
     Scenario,
@@ -14,6 +17,15 @@ from .schema import (
     VALID_STEP_TYPES,
 )
 
+# WIDTHxHEIGHT, case-insensitive 'x'. Signs and padding are accepted so that
+# e.g. '-1x5' is reported as non-positive rather than as a format error.
+_RESOLUTION_RE = re.compile(r"^\s*([+-]?\d+)\s*x\s*([+-]?\d+)\s*$", re.IGNORECASE)
+
+# Human-readable choice lists for error messages, built once.
+_PLATFORM_CHOICES = ", ".join(sorted(VALID_PLATFORMS))
+_STEP_TYPE_CHOICES = ", ".join(sorted(VALID_STEP_TYPES))
+_ASSERTION_TYPE_CHOICES = ", ".join(sorted(VALID_ASSERTION_TYPES))
+
 
 def validate_scenario(scenario: Scenario) -> ValidationResult:
     """Validate a parsed Scenario object.
@@ -81,27 +93,22 @@ def _validate_meta(
     if meta.platform not in VALID_PLATFORMS:
         errors.append(ValidationError(
             path="meta.platform",
-            message=f"Invalid platform '{meta.platform}'. Must be one of: {', '.join(sorted(VALID_PLATFORMS))}",
+            message=f"Invalid platform '{meta.platform}'. Must be one of: {_PLATFORM_CHOICES}",
         ))
 
     # Validate resolution format (WxH)
     if meta.resolution:
-        parts = meta.resolution.lower().split("x")
-        if len(parts) != 2:
+        match = _RESOLUTION_RE.match(meta.resolution)
+        if match is None:
             errors.append(ValidationError(
                 path="meta.resolution",
                 message=f"Invalid resolution format '{meta.resolution}'. Expected 'WIDTHxHEIGHT' (e.g., '1920x1080').",
             ))
-        else:
-            try:
-                w, h = int(parts[0]), int(parts[1])
-                if w <= 0 or h <= 0:
-                    raise ValueError()
-            except ValueError:
-                errors.append(ValidationError(
-                    path="meta.resolution",
-                    message=f"Invalid resolution '{meta.resolution}'. Width and height must be positive integers.",
-                ))
+        elif int(match.group(1)) <= 0 or int(match.group(2)) <= 0:
+            errors.append(ValidationError(
+                path="meta.resolution",
+                message=f"Invalid resolution '{meta.resolution}'. Width and height must be positive integers.",
+            ))
 
     if meta.timeout <= 0:
         errors.append(ValidationError(
@@ -119,65 +126,97 @@ def _validate_steps(
     for i, step in enumerate(scenario.steps):
         path = f"steps[{i}]"
 
-        # Check step type
-        if step.type not in VALID_STEP_TYPES:
+        # Check step type and dispatch to its type-specific validator
+        validate = _STEP_VALIDATORS.get(step.type)
+        if validate is None:
             errors.append(ValidationError(
                 path=f"{path}.type",
-                message=f"Invalid step type '{step.type}'. Must be one of: {', '.join(sorted(VALID_STEP_TYPES))}",
+                message=f"Invalid step type '{step.type}'. Must be one of: {_STEP_TYPE_CHOICES}",
             ))
             continue
 
-        # Type-specific validation
-        if step.type == "input":
-            if not step.target:
-                errors.append(ValidationError(
-                    path=f"{path}.target",
-                    message="'input' step requires 'target'.",
-                ))
-            if step.text is None:
-                errors.append(ValidationError(
-                    path=f"{path}.text",
-                    message="'input' step requires 'text'.",
-                ))
-
-        elif step.type == "click":
-            if not step.target:
-                errors.append(ValidationError(
-                    path=f"{path}.target",
-                    message="'click' step requires 'target'.",
-                ))
-
-        elif step.type == "select":
-            if not step.target:
-                errors.append(ValidationError(
-                    path=f"{path}.target",
-                    message="'select' step requires 'target'.",
-                ))
-            if step.value is None:
-                errors.append(ValidationError(
-                    path=f"{path}.value",
-                    message="'select' step requires 'value'.",
-                ))
-
-        elif step.type == "wait":
-            if step.ms is None:
-                errors.append(ValidationError(
-                    path=f"{path}.ms",
-                    message="'wait' step requires 'ms'.",
-                ))
-            elif step.ms <= 0:
-                errors.append(ValidationError(
-                    path=f"{path}.ms",
-                    message=f"'wait' ms must be positive, got {step.ms}.",
-                ))
-
-        elif step.type == "screenshot":
-            if not step.target and not step.description:
-                warnings.append(ValidationError(
-                    path=path,
-                    message="'screenshot' step has no target or description.",
-                    severity="warning",
-                ))
+        validate(step, path, errors, warnings)
+
+
+def _v_input(
+    step: Step,
+    path: str,
+    errors: list[ValidationError],
+    warnings: list[ValidationError],
+) -> None:
+    if not step.target:
+        errors.append(ValidationError(
+            path=f"{path}.target",
+            message="'input' step requires 'target'.",
+        ))
+    if step.text is None:
+        errors.append(ValidationError(
+            path=f"{path}.text",
+            message="'input' step requires 'text'.",
+        ))
+
+
+def _v_click(
+    step: Step,
+    path: str,
+    errors: list[ValidationError],
+    warnings: list[ValidationError],
+) -> None:
+    if not step.target:
+        errors.append(ValidationError(
+            path=f"{path}.target",
+            message="'click' step requires 'target'.",
+        ))
+
+
+def _v_select(
+    step: Step,
+    path: str,
+    errors: list[ValidationError],
+    warnings: list[ValidationError],
+) -> None:
+    if not step.target:
+        errors.append(ValidationError(
+            path=f"{path}.target",
+            message="'select' step requires 'target'.",
+        ))
+    if step.value is None:
+        errors.append(ValidationError(
+            path=f"{path}.value",
+            message="'select' step requires 'value'.",
+        ))
+
+
+def _v_wait(
+    step: Step,
+    path: str,
+    errors: list[ValidationError],
+    warnings: list[ValidationError],
+) -> None:
+    if step.ms is None:
+        errors.append(ValidationError(
+            path=f"{path}.ms",
+            message="'wait' step requires 'ms'.",
+        ))
+    elif step.ms <= 0:
+        errors.append(ValidationError(
+            path=f"{path}.ms",
+            message=f"'wait' ms must be positive, got {step.ms}.",
+        ))
+
+
+def _v_screenshot(
+    step: Step,
+    path: str,
+    errors: list[ValidationError],
+    warnings: list[ValidationError],
+) -> None:
+    if not step.target and not step.description:
+        warnings.append(ValidationError(
+            path=path,
+            message="'screenshot' step has no target or description.",
+            severity="warning",
+        ))
 
 
 def _validate_assertions(
@@ -192,7 +231,7 @@ def _validate_assertions(
         if assertion.type not in VALID_ASSERTION_TYPES:
             errors.append(ValidationError(
                 path=f"{path}.type",
-                message=f"Invalid assertion type '{assertion.type}'. Must be one of: {', '.join(sorted(VALID_ASSERTION_TYPES))}",
+                message=f"Invalid assertion type '{assertion.type}'. Must be one of: {_ASSERTION_TYPE_CHOICES}",
             ))
 
         if not assertion.name:
@@ -201,9 +240,41 @@ def _validate_assertions(
                 message="Assertion 'name' is required and must not be empty.",
             ))
 
-        if assertion.type == "screenshot" and not assertion.description:
-            warnings.append(ValidationError(
-                path=f"{path}.description",
-                message="Screenshot assertion without 'description' limits VLM validation accuracy.",
-                severity="warning",
-            ))
+        validate = _ASSERTION_VALIDATORS.get(assertion.type)
+        if validate is not None:
+            validate(assertion, path, errors, warnings)
+
+
+def _va_screenshot(
+    assertion: Assertion,
+    path: str,
+    errors: list[ValidationError],
+    warnings: list[ValidationError],
+) -> None:
+    if not assertion.description:
+        warnings.append(ValidationError(
+            path=f"{path}.description",
+            message="Screenshot assertion without 'description' limits VLM validation accuracy.",
+            severity="warning",
+        ))
+
+
+# Type-specific validators, keyed by the normalized ``type`` value.
+# Every StepType must have an entry; this table defines which step types
+# are valid. Assertion types without extra rules need no entry.
+_STEP_VALIDATORS: dict[
+    str, Callable[[Step, str, list[ValidationError], list[ValidationError]], None]
+] = {
+    "input": _v_input,
+    "click": _v_click,
+    "select": _v_select,
+    "wait": _v_wait,
+    "screenshot": _v_screenshot,
+}
+
+_ASSERTION_VALIDATORS: dict[
+    str,
+    Callable[[Assertion, str, list[ValidationError], list[ValidationError]], None],
+] = {
+    "screenshot": _va_screenshot,
+}
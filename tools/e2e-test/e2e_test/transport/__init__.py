@@ -1,7 +1,9 @@
 """Transport module - HTTP communication."""
 
+from .async_http_client import AsyncE2EHttpClient
 from .http_client import (
     E2EHttpClient,
+    EventStreamUnavailable,
     LogEntry,
     ScreenshotData,
     TestResult,
@@ -16,7 +18,9 @@ from .retry_policy import (
 )
 
 __all__ = [
+    "AsyncE2EHttpClient",
     "E2EHttpClient",
+    "EventStreamUnavailable",
     "LogEntry",
     "ScreenshotData",
     "TestResult",
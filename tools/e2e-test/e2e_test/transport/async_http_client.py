@@ -0,0 +1,269 @@
+"""Asyncio HTTP client for driving many target apps from one event loop.
+
+Speaks the same protocol as E2EHttpClient and returns the same dataclasses.
+Requires the optional ``httpx`` package; HTTP/2 is used when ``h2`` is
+installed as well. Status updates are polled (no /e2e/events stream).
+"""
+
+import asyncio
+import importlib.util
+import time
+from typing import Any, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from ..utils.json_compat import dumps_bytes as json_dumps_bytes, loads as json_loads
+from .http_client import (
+    NEAR_COMPLETE_POLL_INTERVAL,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    TestResult,
+    TestSession,
+    TestStatus,
+    _jitter,
+    _parse_multipart_result,
+    _parse_result,
+    _parse_session,
+    _retry_after,
+)
+from .retry_policy import RETRY_STATUSES, RetryPolicy, default_retry_policy
+
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+class AsyncE2EHttpClient:
+    """Async HTTP client for E2E test communication.
+
+    Each instance owns one ``httpx.AsyncClient``; an httpx client is bound
+    to the event loop it was first used on, so it is not shared module-wide.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        retry_policy: Optional[RetryPolicy] = None,
+        request_timeout: float = 30.0,
+    ):
+        """Initialize async HTTP client.
+
+        Args:
+            base_url: Base URL of target app (e.g., http://192.168.1.100:51321).
+            retry_policy: Retry configuration. Uses default if None.
+            request_timeout: Default request timeout in seconds.
+
+        Raises:
+            ImportError: If httpx is not installed.
+        """
+        if httpx is None:
+            raise ImportError("AsyncE2EHttpClient requires httpx. Run: pip install httpx")
+
+        self.base_url = base_url.rstrip("/")
+        self.retry_policy = retry_policy or default_retry_policy()
+        self.request_timeout = request_timeout
+        self._client = httpx.AsyncClient(
+            http2=_HTTP2,
+            limits=httpx.Limits(
+                max_keepalive_connections=POOL_MAXSIZE,
+                max_connections=POOL_MAXSIZE + POOL_CONNECTIONS,
+            ),
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            },
+            timeout=request_timeout,
+        )
+
+    async def post_run(self, scenario: dict[str, Any]) -> TestSession:
+        """Submit a test scenario for execution (POST /e2e/run).
+
+        Args:
+            scenario: Scenario dict (from Scenario.to_dict()).
+
+        Returns:
+            TestSession with session_id.
+        """
+        response = await self._request_with_retry(
+            "POST",
+            f"{self.base_url}/e2e/run",
+            content=json_dumps_bytes({"scenario": scenario}),
+            timeout=10,
+        )
+        return _parse_session(json_loads(response.content))
+
+    async def get_status(self, session_id: str) -> TestStatus:
+        """Get current test execution status (GET /e2e/status/:session_id).
+
+        Args:
+            session_id: Test session identifier.
+
+        Returns:
+            TestStatus with current progress.
+        """
+        return await self.get_status_into(session_id, TestStatus(status="submitted"))
+
+    async def get_status_into(self, session_id: str, status: TestStatus) -> TestStatus:
+        """Like get_status, but refresh an existing TestStatus in place.
+
+        Args:
+            session_id: Test session identifier.
+            status: Instance to overwrite with the current status.
+
+        Returns:
+            The same status instance.
+        """
+        response = await self._request_with_retry(
+            "GET",
+            f"{self.base_url}/e2e/status/{session_id}",
+            timeout=5,
+        )
+        return status.update_from(json_loads(response.content))
+
+    async def get_result(self, session_id: str) -> TestResult:
+        """Get test execution results (GET /e2e/result/:session_id).
+
+        Negotiates multipart/mixed like E2EHttpClient.get_result_binary, so
+        screenshots arrive as raw bytes when the app supports it.
+
+        Args:
+            session_id: Test session identifier.
+
+        Returns:
+            TestResult with screenshots and logs.
+        """
+        response = await self._request_with_retry(
+            "GET",
+            f"{self.base_url}/e2e/result/{session_id}",
+            headers={"Accept": "multipart/mixed, application/json;q=0.9"},
+            timeout=self.request_timeout,
+        )
+        content_type = response.headers.get("Content-Type", "")
+        if content_type.startswith("multipart/"):
+            return _parse_multipart_result(response.content, content_type)
+        return _parse_result(json_loads(response.content))
+
+    async def poll_until_complete(
+        self,
+        session_id: str,
+        timeout: float = 300.0,
+        poll_interval: float = 2.0,
+        on_progress: Optional[callable] = None,
+        max_poll_interval: Optional[float] = None,
+    ) -> TestResult:
+        """Poll status until test completes, then return result.
+
+        Uses the same jittered schedule as E2EHttpClient.poll_until_complete,
+        sleeping with asyncio.sleep so other sessions keep running.
+
+        Args:
+            session_id: Test session identifier.
+            timeout: Maximum wait time in seconds.
+            poll_interval: Typical seconds between status checks.
+            on_progress: Optional callback(TestStatus) for progress updates;
+                the instance is reused between polls.
+            max_poll_interval: Longest gap between checks (default
+                2 * poll_interval).
+
+        Returns:
+            TestResult when test completes.
+
+        Raises:
+            TimeoutError: If test doesn't complete within timeout.
+            RuntimeError: If test fails.
+        """
+        deadline = time.monotonic() + timeout
+        base = poll_interval / 2
+        cap = max_poll_interval if max_poll_interval is not None else poll_interval * 2
+        sleep_for = base
+        status = TestStatus(status="submitted")
+
+        while time.monotonic() < deadline:
+            await self.get_status_into(session_id, status)
+
+            if on_progress:
+                on_progress(status)
+
+            if status.is_completed:
+                return await self.get_result(session_id)
+
+            if status.is_failed:
+                result = await self.get_result(session_id)
+                raise RuntimeError(
+                    f"Test failed: {result.error or 'Unknown error'}"
+                )
+
+            sleep_for = min(cap, _jitter.uniform(base, sleep_for * 3))
+            if status.progress >= 0.9:
+                sleep_for = min(sleep_for, NEAR_COMPLETE_POLL_INTERVAL)
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                await asyncio.sleep(min(sleep_for, remaining))
+
+        raise TimeoutError(
+            f"Test did not complete within {timeout}s"
+        )
+
+    async def health_check(self) -> bool:
+        """Check if the target app's E2E server is reachable.
+
+        Returns:
+            True if server responds.
+        """
+        try:
+            response = await self._client.get(
+                f"{self.base_url}/e2e/status/health",
+                timeout=5,
+            )
+        except httpx.TransportError:
+            return False
+        return response.status_code < 500
+
+    async def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        **kwargs,
+    ) -> "httpx.Response":
+        """Execute HTTP request with the same retry rules as E2EHttpClient.
+
+        Raises:
+            httpx.HTTPStatusError: On a non-retryable status, or after all
+                retries are exhausted.
+            httpx.TransportError: If the app stays unreachable.
+        """
+        policy = self.retry_policy
+
+        for attempt in range(policy.max_retries + 1):
+            retries_left = attempt < policy.max_retries
+            try:
+                response = await self._client.request(method, url, **kwargs)
+            except httpx.TransportError:
+                if not retries_left:
+                    raise
+                await asyncio.sleep(policy.get_delay(attempt))
+                continue
+
+            if response.status_code in RETRY_STATUSES and retries_left:
+                await asyncio.sleep(max(
+                    _retry_after(response.headers, policy.max_delay),
+                    policy.get_delay(attempt),
+                ))
+                continue
+
+            response.raise_for_status()
+            return response
+
+        # The last attempt always returns or raises.
+        raise RuntimeError("Request failed with no error captured")
+
+    async def aclose(self) -> None:
+        """Close the underlying httpx client and its connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
@@ -3,26 +3,79 @@
 Implements the HTTP transport protocol:
 - POST /e2e/run   - Submit test scenario
 - GET /e2e/status  - Poll test status
-- GET /e2e/result  - Retrieve test results
+- GET /e2e/result  - Retrieve test results (JSON, or multipart/mixed with
+                     raw PNG parts when the app supports it)
+- GET /e2e/events  - Optional server-sent status stream (polling fallback)
 """
 
+import email.message
+import email.utils
+import math
+import random
 import time
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Iterator, Mapping, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from .retry_policy import RetryPolicy, default_retry_policy
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
 
+from ..utils.json_compat import dumps_bytes as json_dumps_bytes, loads as json_loads
+from .retry_policy import RETRY_STATUSES, RetryPolicy, default_retry_policy
 
-@dataclass
+
+# Per-host pools and connections per pool for the process-wide adapter,
+# sized for several devices polled from parallel workers.
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+
+_SHARED_ADAPTER: Optional[HTTPAdapter] = None
+
+# Poll gap once the app reports >= 90% progress.
+NEAR_COMPLETE_POLL_INTERVAL = 0.25
+
+# Seconds a health_check() result is reused before probing again.
+HEALTH_CACHE_TTL = 2.0
+
+# Read size for streamed /e2e/result bodies.
+RESULT_CHUNK_BYTES = 64 * 1024
+
+class EventStreamUnavailable(Exception):
+    """The target app does not serve a status event stream."""
+
+
+# Per-process RNG for poll jitter, so concurrent runners stay decorrelated.
+_jitter = random.Random()
+
+
+def _shared_adapter() -> HTTPAdapter:
+    """Return the process-wide keep-alive adapter, creating it on first use.
+
+    Retries are handled by E2EHttpClient._request_with_retry, not urllib3.
+    """
+    global _SHARED_ADAPTER
+    if _SHARED_ADAPTER is None:
+        _SHARED_ADAPTER = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            pool_block=False,
+            max_retries=0,
+        )
+    return _SHARED_ADAPTER
+
+
+@dataclass(slots=True)
 class TestSession:
     """Active test session info."""
     session_id: str
     status: str = "submitted"
 
 
-@dataclass
+@dataclass(slots=True)
 class TestStatus:
     """Test execution status."""
     status: str
@@ -30,6 +83,14 @@ class TestStatus:
     current_step: int = 0
     total_steps: int = 0
 
+    def update_from(self, data: dict[str, Any]) -> "TestStatus":
+        """Overwrite every field from a /e2e/status JSON document."""
+        self.status = data["status"]
+        self.progress = data.get("progress", 0.0)
+        self.current_step = data.get("current_step", 0)
+        self.total_steps = data.get("total_steps", 0)
+        return self
+
     @property
     def is_running(self) -> bool:
         return self.status == "running"
@@ -43,14 +104,24 @@ class TestStatus:
         return self.status == "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class ScreenshotData:
-    """Screenshot captured during test."""
+    """Screenshot captured during test.
+
+    JSON results carry base64 ``data``; multipart results carry the PNG as
+    ``raw_bytes`` instead and leave ``data`` empty.
+    """
     name: str
-    data: str  # base64 encoded
+    data: str = ""  # base64 encoded
+    raw_bytes: Optional[bytes] = None
+
+    @property
+    def content(self) -> str | bytes:
+        """Raw image bytes when available, otherwise the base64 string."""
+        return self.raw_bytes if self.raw_bytes is not None else self.data
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """Log entry from test execution."""
     timestamp: str
@@ -58,7 +129,7 @@ class LogEntry:
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Complete test result."""
     status: str
@@ -94,10 +165,23 @@ class E2EHttpClient:
         self.base_url = base_url.rstrip("/")
         self.retry_policy = retry_policy or default_retry_policy()
         self.request_timeout = request_timeout
+        # None until the first attempt; False once the app answered that it
+        # has no event stream, so later waits go straight to polling.
+        self._events_supported: Optional[bool] = None
+        # (monotonic timestamp, result) of the last health probe.
+        self._health_cache: Optional[tuple[float, bool]] = None
+        self._health_ttl = HEALTH_CACHE_TTL
+        # Submit, every status poll and the result fetch go through one
+        # process-wide keep-alive pool, so consecutive runs against the same
+        # app (e.g. a scenario directory) also reuse the open connection.
+        adapter = _shared_adapter()
         self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
         self._session.headers.update({
             "Content-Type": "application/json",
             "Accept": "application/json",
+            "Connection": "keep-alive",
         })
 
     def post_run(self, scenario: dict[str, Any]) -> TestSession:
@@ -118,14 +202,10 @@ class E2EHttpClient:
         response = self._request_with_retry(
             "POST",
             f"{self.base_url}/e2e/run",
-            json={"scenario": scenario},
+            data=json_dumps_bytes({"scenario": scenario}),
             timeout=10,
         )
-        data = response.json()
-        return TestSession(
-            session_id=data["session_id"],
-            status=data.get("status", "running"),
-        )
+        return _parse_session(json_loads(response.content))
 
     def get_status(self, session_id: str) -> TestStatus:
         """Get current test execution status.
@@ -143,19 +223,34 @@ class E2EHttpClient:
             f"{self.base_url}/e2e/status/{session_id}",
             timeout=5,
         )
-        data = response.json()
-        return TestStatus(
-            status=data["status"],
-            progress=data.get("progress", 0.0),
-            current_step=data.get("current_step", 0),
-            total_steps=data.get("total_steps", 0),
+        return _parse_status(json_loads(response.content))
+
+    def get_status_into(self, session_id: str, status: TestStatus) -> TestStatus:
+        """Like get_status, but refresh an existing TestStatus in place.
+
+        Args:
+            session_id: Test session identifier.
+            status: Instance to overwrite with the current status.
+
+        Returns:
+            The same status instance.
+        """
+        response = self._request_with_retry(
+            "GET",
+            f"{self.base_url}/e2e/status/{session_id}",
+            timeout=5,
         )
+        return status.update_from(json_loads(response.content))
 
     def get_result(self, session_id: str) -> TestResult:
         """Get test execution results.
 
         GET /e2e/result/:session_id
 
+        With ijson installed the body is parsed as it streams in, so only
+        one screenshot object is held as a dict at a time instead of the
+        whole document.
+
         Args:
             session_id: Test session identifier.
 
@@ -166,28 +261,38 @@ class E2EHttpClient:
             "GET",
             f"{self.base_url}/e2e/result/{session_id}",
             timeout=self.request_timeout,
+            stream=ijson is not None,
         )
-        data = response.json()
-
-        screenshots = [
-            ScreenshotData(name=s["name"], data=s["data"])
-            for s in data.get("screenshots", [])
-        ]
-        logs = [
-            LogEntry(
-                timestamp=log.get("timestamp", ""),
-                level=log.get("level", "info"),
-                message=log.get("message", ""),
-            )
-            for log in data.get("logs", [])
-        ]
-
-        return TestResult(
-            status=data["status"],
-            screenshots=screenshots,
-            logs=logs,
-            error=data.get("error"),
+        return _read_result(response)
+
+    def get_result_binary(self, session_id: str) -> TestResult:
+        """Get test execution results with screenshots as raw bytes.
+
+        GET /e2e/result/:session_id with ``Accept: multipart/mixed``. The app
+        answers with one ``application/json`` part holding the result
+        document and one ``image/*`` part per screenshot, named by the
+        part's Content-Disposition ``name``. That skips the 33% base64
+        inflation and the decode on this side. Apps that only speak JSON
+        ignore the header, and their response is parsed as by get_result.
+
+        Args:
+            session_id: Test session identifier.
+
+        Returns:
+            TestResult with screenshots and logs.
+        """
+        response = self._request_with_retry(
+            "GET",
+            f"{self.base_url}/e2e/result/{session_id}",
+            headers={"Accept": "multipart/mixed, application/json;q=0.9"},
+            timeout=self.request_timeout,
+            stream=ijson is not None,
         )
+        content_type = response.headers.get("Content-Type", "")
+        if not content_type.startswith("multipart/"):
+            return _read_result(response)
+
+        return _parse_multipart_result(response.content, content_type)
 
     def poll_until_complete(
         self,
@@ -195,14 +300,24 @@ class E2EHttpClient:
         timeout: float = 300.0,
         poll_interval: float = 2.0,
         on_progress: Optional[callable] = None,
+        max_poll_interval: Optional[float] = None,
     ) -> TestResult:
         """Poll status until test completes, then return result.
 
+        Poll gaps use decorrelated jitter between ``poll_interval / 2`` and
+        ``max_poll_interval``: short while a test has just started, longer
+        during long runs, and never in lockstep across parallel runners.
+        Once the app reports 90% progress the gap drops to
+        NEAR_COMPLETE_POLL_INTERVAL so completion is noticed quickly.
+
         Args:
             session_id: Test session identifier.
             timeout: Maximum wait time in seconds.
-            poll_interval: Interval between polls in seconds.
-            on_progress: Optional callback(TestStatus) on each poll.
+            poll_interval: Typical interval between polls in seconds.
+            on_progress: Optional callback(TestStatus) on each poll. The
+                polling loop reuses one instance, so copy what you keep.
+            max_poll_interval: Longest gap between polls. Default: 2x
+                poll_interval.
 
         Returns:
             TestResult when test completes.
@@ -211,43 +326,188 @@ class E2EHttpClient:
             TimeoutError: If test doesn't complete within timeout.
             RuntimeError: If test fails.
         """
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
 
-        while time.time() - start_time < timeout:
-            status = self.get_status(session_id)
+        if self._events_supported is not False:
+            result = self._wait_via_events(session_id, deadline, on_progress)
+            if result is not None:
+                return result
+
+        base = poll_interval / 2
+        cap = max_poll_interval if max_poll_interval is not None else poll_interval * 2
+        sleep_for = base  # first gap averages poll_interval, later ones grow
+        # One instance refreshed by every poll; on_progress must not keep it.
+        status = TestStatus(status="submitted")
+
+        while time.monotonic() < deadline:
+            self.get_status_into(session_id, status)
 
             if on_progress:
                 on_progress(status)
 
             if status.is_completed:
-                return self.get_result(session_id)
+                return self.get_result_binary(session_id)
 
             if status.is_failed:
-                result = self.get_result(session_id)
+                result = self.get_result_binary(session_id)
                 raise RuntimeError(
                     f"Test failed: {result.error or 'Unknown error'}"
                 )
 
-            time.sleep(poll_interval)
+            sleep_for = min(cap, _jitter.uniform(base, sleep_for * 3))
+            if status.progress >= 0.9:
+                sleep_for = min(sleep_for, NEAR_COMPLETE_POLL_INTERVAL)
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                time.sleep(min(sleep_for, remaining))
 
         raise TimeoutError(
             f"Test did not complete within {timeout}s"
         )
 
+    def stream_status(
+        self,
+        session_id: str,
+        read_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[TestStatus]:
+        """Stream status updates pushed by the target app.
+
+        GET /e2e/events/:session_id (``text/event-stream``)
+
+        Each SSE event's ``data`` carries the same JSON as GET /e2e/status.
+
+        Args:
+            session_id: Test session identifier.
+            read_timeout: Max seconds to wait for the next chunk of the stream.
+            deadline: time.monotonic() value after which the stream is
+                abandoned. Checked on every line, so keep-alive comments
+                (which reset read_timeout) cannot extend the wait.
+
+        Yields:
+            TestStatus for each pushed event.
+
+        Raises:
+            EventStreamUnavailable: If the app does not provide an event stream.
+            requests.Timeout: If no data arrives within read_timeout, or
+                the deadline passes.
+        """
+        response = self._session.get(
+            f"{self.base_url}/e2e/events/{session_id}",
+            headers={"Accept": "text/event-stream"},
+            stream=True,
+            timeout=(5, read_timeout or self.request_timeout),
+        )
+        with response:
+            content_type = response.headers.get("Content-Type", "")
+            if response.status_code != 200 or "text/event-stream" not in content_type:
+                # Drain the (small) error body so the connection goes back
+                # to the keep-alive pool instead of being dropped.
+                response.content
+                raise EventStreamUnavailable(
+                    f"No event stream (HTTP {response.status_code}, {content_type or 'no content type'})"
+                )
+
+            data_lines: list[str] = []
+            for line in response.iter_lines(decode_unicode=True):
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise requests.Timeout("Event stream deadline passed")
+                if line:
+                    if line.startswith("data:"):
+                        data_lines.append(line[5:].lstrip())
+                    # "event:", "id:", "retry:" and ":" comments are ignored
+                    continue
+                if not data_lines:
+                    continue
+                data = json_loads("\n".join(data_lines))
+                data_lines.clear()
+                yield _parse_status(data)
+
+    def _wait_via_events(
+        self,
+        session_id: str,
+        deadline: float,
+        on_progress: Optional[callable],
+    ) -> Optional[TestResult]:
+        """Wait for completion on the event stream.
+
+        Reads use request_timeout rather than the whole test budget, so an
+        app that accepts the request but never sends anything costs one
+        request_timeout before polling takes over.
+
+        Returns:
+            TestResult on completion, or None when the caller should fall
+            back to polling (no stream support, the stream stalled or ended
+            early, or the deadline passed).
+
+        Raises:
+            RuntimeError: If the test fails.
+        """
+        received = False
+        try:
+            for status in self.stream_status(
+                session_id,
+                read_timeout=max(min(self.request_timeout, deadline - time.monotonic()), 0.1),
+                deadline=deadline,
+            ):
+                received = True
+                self._events_supported = True
+
+                if on_progress:
+                    on_progress(status)
+
+                if status.is_completed:
+                    return self.get_result_binary(session_id)
+
+                if status.is_failed:
+                    result = self.get_result_binary(session_id)
+                    raise RuntimeError(
+                        f"Test failed: {result.error or 'Unknown error'}"
+                    )
+
+                if time.monotonic() >= deadline:
+                    break
+        except EventStreamUnavailable:
+            self._events_supported = False
+            return None
+        except (requests.ConnectionError, requests.Timeout, ValueError, KeyError):
+            # Dropped, stalled or malformed stream - resume by polling. A
+            # stream that never delivered an event is not tried again.
+            if not received:
+                self._events_supported = False
+
+        # Past the deadline the polling loop is skipped and raises TimeoutError.
+        return None
+
     def health_check(self) -> bool:
         """Check if the target app's E2E server is reachable.
 
+        Results are cached for HEALTH_CACHE_TTL seconds, so back-to-back
+        checks cost one probe.
+
         Returns:
             True if server responds.
         """
+        now = time.monotonic()
+        cached = self._health_cache
+        if cached is not None and now - cached[0] < self._health_ttl:
+            return cached[1]
+
         try:
             response = self._session.get(
                 f"{self.base_url}/e2e/status/health",
                 timeout=5,
             )
-            return response.status_code < 500
+            healthy = response.status_code < 500
         except (requests.ConnectionError, requests.Timeout):
-            return False
+            healthy = False
+
+        self._health_cache = (now, healthy)
+        return healthy
+
+    def invalidate_health_cache(self) -> None:
+        """Forget the cached health_check() result (e.g. after a failure)."""
+        self._health_cache = None
 
     def _request_with_retry(
         self,
@@ -265,50 +525,49 @@ class E2EHttpClient:
         Returns:
             Response object.
 
+        Statuses in RETRY_STATUSES are retried with the policy's backoff,
+        or after the server's Retry-After if that is longer (capped at
+        max_delay); any other error status raises at once.
+
         Raises:
-            requests.HTTPError: After all retries exhausted.
+            requests.HTTPError: On a non-retryable status, or after all
+                retries are exhausted.
         """
-        last_error: Optional[Exception] = None
+        policy = self.retry_policy
 
-        for attempt in range(self.retry_policy.max_retries + 1):
+        for attempt in range(policy.max_retries + 1):
+            retries_left = attempt < policy.max_retries
             try:
                 response = self._session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self.invalidate_health_cache()
+                if not retries_left:
+                    raise
+                time.sleep(policy.get_delay(attempt))
+                continue
+
+            if response.status_code in RETRY_STATUSES and retries_left:
+                delay = max(
+                    _retry_after(response.headers, policy.max_delay),
+                    policy.get_delay(attempt),
+                )
+                response.close()
+                time.sleep(delay)
+                continue
 
-                if response.status_code < 500:
-                    response.raise_for_status()
-                    return response
-
-                # 5xx - retry
-                if attempt < self.retry_policy.max_retries:
-                    delay = self.retry_policy.get_delay(attempt)
-                    time.sleep(delay)
-                    continue
-
-                response.raise_for_status()
-
-            except requests.ConnectionError as e:
-                last_error = e
-                if attempt < self.retry_policy.max_retries:
-                    delay = self.retry_policy.get_delay(attempt)
-                    time.sleep(delay)
-                    continue
-                raise
-
-            except requests.Timeout as e:
-                last_error = e
-                if attempt < self.retry_policy.max_retries:
-                    delay = self.retry_policy.get_delay(attempt)
-                    time.sleep(delay)
-                    continue
-                raise
+            response.raise_for_status()
+            return response
 
-        # Should not reach here, but just in case
-        if last_error:
-            raise last_error
+        # The last attempt always returns or raises.
         raise RuntimeError("Request failed with no error captured")
 
     def close(self) -> None:
-        """Close the HTTP session."""
+        """Close the HTTP session.
+
+        The shared connection pool is detached first and stays open for
+        the next client.
+        """
+        self._session.adapters.clear()
         self._session.close()
 
     def __enter__(self):
@@ -316,3 +575,172 @@ class E2EHttpClient:
 
     def __exit__(self, *args):
         self.close()
+
+
+def _retry_after(headers: Mapping[str, str], max_delay: float) -> float:
+    """Seconds requested by a Retry-After header (delta or HTTP date), capped."""
+    value = headers.get("Retry-After")
+    if not value:
+        return 0.0
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return 0.0
+        seconds = when.timestamp() - time.time()
+    if not math.isfinite(seconds):
+        return 0.0
+    return min(max(seconds, 0.0), max_delay)
+
+
+def _parse_session(data: dict[str, Any]) -> TestSession:
+    """Build a TestSession from a /e2e/run JSON document."""
+    return TestSession(
+        session_id=data["session_id"],
+        status=data.get("status", "running"),
+    )
+
+
+def _parse_status(data: dict[str, Any]) -> TestStatus:
+    """Build a TestStatus from a /e2e/status JSON document."""
+    return TestStatus(status=data["status"]).update_from(data)
+
+
+def _parse_result(data: dict[str, Any]) -> TestResult:
+    """Build a TestResult from a /e2e/result JSON document."""
+    screenshots = [
+        ScreenshotData(name=s["name"], data=s["data"])
+        for s in data.get("screenshots", [])
+        if "data" in s
+    ]
+    logs = [_log_entry(log) for log in data.get("logs", [])]
+
+    return TestResult(
+        status=data["status"],
+        screenshots=screenshots,
+        logs=logs,
+        error=data.get("error"),
+    )
+
+
+def _parse_multipart_result(body: bytes, content_type: str) -> TestResult:
+    """Build a TestResult from a multipart/mixed /e2e/result body."""
+    data: dict[str, Any] = {}
+    raw_screenshots: list[ScreenshotData] = []
+    for headers, payload in _iter_multipart(body, content_type):
+        part_type = headers.get("content-type", "")
+        if part_type.startswith("application/json"):
+            data = json_loads(payload)
+        elif part_type.startswith("image/"):
+            raw_screenshots.append(ScreenshotData(
+                name=_part_name(headers.get("content-disposition", "")),
+                raw_bytes=payload,
+            ))
+
+    result = _parse_result(data)
+    result.screenshots.extend(raw_screenshots)
+    return result
+
+
+def _log_entry(log: dict[str, Any]) -> LogEntry:
+    return LogEntry(
+        timestamp=log.get("timestamp", ""),
+        level=log.get("level", "info"),
+        message=log.get("message", ""),
+    )
+
+
+def _read_result(response: requests.Response) -> TestResult:
+    """Parse a JSON /e2e/result response, incrementally when ijson is available."""
+    if ijson is None:
+        return _parse_result(json_loads(response.content))
+    with response:
+        try:
+            return _stream_result(response.iter_content(RESULT_CHUNK_BYTES))
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid result JSON: {e}") from e
+
+
+class _ChunkReader:
+    """Minimal file-like view over an iterator of byte chunks, for ijson."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+
+    def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to tell bytes from text streams.
+        if size == 0:
+            return b""
+        return next(self._chunks, b"")
+
+
+def _stream_result(chunks: Iterator[bytes]) -> TestResult:
+    """Build a TestResult from streamed JSON, one screenshot or log at a time."""
+    fields: dict[str, Any] = {}
+    screenshots: list[ScreenshotData] = []
+    logs: list[LogEntry] = []
+    builder = None
+    item_prefix = ""
+
+    for prefix, event, value in ijson.parse(_ChunkReader(chunks)):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == item_prefix and event == "end_map":
+                item = builder.value
+                builder = None
+                if item_prefix == "logs.item":
+                    logs.append(_log_entry(item))
+                elif "data" in item:
+                    screenshots.append(ScreenshotData(name=item["name"], data=item["data"]))
+        elif event == "start_map" and prefix in ("screenshots.item", "logs.item"):
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            item_prefix = prefix
+        elif prefix in ("status", "error") and event in ("string", "null"):
+            fields[prefix] = value
+
+    return TestResult(
+        status=fields["status"],
+        screenshots=screenshots,
+        logs=logs,
+        error=fields.get("error"),
+    )
+
+
+def _iter_multipart(body: bytes, content_type: str) -> Iterator[tuple[dict[str, str], bytes]]:
+    """Split a multipart body into (lower-cased headers, payload) pairs.
+
+    Raises:
+        ValueError: If the Content-Type carries no boundary.
+    """
+    header = email.message.Message()
+    header["Content-Type"] = content_type
+    boundary = header.get_param("boundary")
+    if not boundary:
+        raise ValueError(f"Multipart response without boundary: {content_type}")
+
+    delimiter = b"\r\n--" + str(boundary).encode("latin-1")
+    # Prefix CRLF so the first delimiter matches like the others.
+    for chunk in (b"\r\n" + body).split(delimiter)[1:]:
+        if chunk.startswith(b"--"):
+            break
+        head, _, payload = chunk.partition(b"\r\n\r\n")
+        headers: dict[str, str] = {}
+        for line in head.split(b"\r\n"):
+            key, sep, value = line.partition(b":")
+            if sep:
+                headers[key.strip().lower().decode("latin-1")] = value.strip().decode("latin-1")
+        yield headers, payload
+
+
+def _part_name(disposition: str) -> str:
+    """Screenshot name from a part's Content-Disposition (name, then filename)."""
+    header = email.message.Message()
+    header["Content-Disposition"] = disposition
+    name = header.get_param("name", header="content-disposition")
+    if not name:
+        filename = header.get_param("filename", header="content-disposition")
+        name = str(filename).rsplit(".", 1)[0] if filename else None
+    return str(name) if name else "unnamed"
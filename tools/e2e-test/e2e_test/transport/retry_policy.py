@@ -3,8 +3,15 @@
 Provides configurable retry logic with exponential backoff.
 """
 
+import random
 from dataclasses import dataclass
 
+# Per-process RNG so retries from concurrent workers stay decorrelated.
+_rng = random.Random()
+
+# HTTP statuses worth retrying: timeouts, throttling and transient server errors.
+RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
 
 @dataclass
 class RetryPolicy:
@@ -13,24 +20,33 @@ class RetryPolicy:
     initial_delay: float = 1.0
     backoff_factor: float = 2.0
     max_delay: float = 30.0
+    jitter: str = "full"  # "full", "equal" or "none"
 
     def get_delay(self, attempt: int) -> float:
         """Calculate delay for a given retry attempt (0-indexed).
 
+        The exponential delay, capped at max_delay, is randomized so that
+        clients failing together don't retry together: "full" picks from
+        [0, cap], "equal" from [cap/2, cap], and "none" returns cap.
+
         Args:
             attempt: Current attempt number (0 = first retry).
 
         Returns:
             Delay in seconds before next retry.
         """
-        delay = self.initial_delay * (self.backoff_factor ** attempt)
-        return min(delay, self.max_delay)
+        cap = min(self.initial_delay * (self.backoff_factor ** attempt), self.max_delay)
+        if self.jitter == "full":
+            return _rng.uniform(0, cap)
+        if self.jitter == "equal":
+            return cap / 2 + _rng.uniform(0, cap / 2)
+        return cap
 
 
 def default_retry_policy() -> RetryPolicy:
     """Create default retry policy.
 
-    3 retries, 1s initial delay, 2x backoff, 30s max.
+    3 retries, 1s initial delay, 2x backoff, 30s max, full jitter.
     """
     return RetryPolicy()
 
@@ -38,7 +54,7 @@ def default_retry_policy() -> RetryPolicy:
 def aggressive_retry_policy() -> RetryPolicy:
     """Create aggressive retry policy for flaky connections.
 
-    5 retries, 0.5s initial delay, 1.5x backoff, 10s max.
+    5 retries, 0.5s initial delay, 1.5x backoff, 10s max, full jitter.
     """
     return RetryPolicy(
         max_retries=5,
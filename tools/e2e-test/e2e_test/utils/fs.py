@@ -0,0 +1,22 @@
+"""Filesystem helpers."""
+
+from pathlib import Path
+
+# Directories this process has already created or confirmed to exist.
+_KNOWN_DIRS: set[Path] = set()
+
+
+def ensure_dir(path: Path) -> None:
+    """Create a directory (and parents) unless it was already ensured.
+
+    Repeated calls for the same directory skip the stat/mkdir walk up the
+    tree. Directories removed behind the process's back are not noticed.
+
+    Args:
+        path: Directory to create.
+    """
+    path = Path(path)
+    if path in _KNOWN_DIRS:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _KNOWN_DIRS.add(path)
@@ -0,0 +1,97 @@
+"""JSON helpers that use orjson or msgspec when they are installed.
+
+Both are optional; encoding prefers orjson, then msgspec, and everything
+falls back to the stdlib json module so the CLI stays dependency-light.
+Dataclass instances are serialized as objects on every backend.
+"""
+
+import dataclasses
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+_MSGSPEC_ENCODER = msgspec.json.Encoder() if msgspec is not None else None
+
+
+def _default(obj: Any) -> Any:
+    """stdlib ``default`` hook: encode dataclasses the way orjson/msgspec do."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON.
+
+    Args:
+        obj: JSON-serializable object.
+        pretty: If True, indent with two spaces.
+
+    Returns:
+        JSON document as UTF-8 bytes.
+    """
+    if orjson is not None:
+        try:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # Oversized ints, unsupported types, etc. - let the stdlib handle them.
+            pass
+    elif _MSGSPEC_ENCODER is not None:
+        try:
+            data = _MSGSPEC_ENCODER.encode(obj)
+        except (TypeError, msgspec.EncodeError):
+            pass
+        else:
+            # Encode compact once; indent only when pretty output is asked for.
+            return msgspec.json.format(data, indent=2) if pretty else data
+    return json.dumps(
+        obj, indent=2 if pretty else None, ensure_ascii=False, default=_default
+    ).encode("utf-8")
+
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize obj to a JSON string without escaping non-ASCII text.
+
+    Args:
+        obj: JSON-serializable object.
+        pretty: If True, indent with two spaces.
+
+    Returns:
+        JSON string (compact unless pretty).
+    """
+    if orjson is None and _MSGSPEC_ENCODER is None:
+        return json.dumps(
+            obj, indent=2 if pretty else None, ensure_ascii=False, default=_default
+        )
+    return dumps_bytes(obj, pretty).decode("utf-8")
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Parse a JSON document from text or a UTF-8 buffer.
+
+    Args:
+        data: JSON text, or bytes-like UTF-8 encoded JSON.
+
+    Returns:
+        Parsed object.
+
+    Raises:
+        ValueError: If data is not valid UTF-8 or not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if not isinstance(data, str):
+        data = str(data, "utf-8")
+    return json.loads(data)
@@ -1,10 +1,11 @@
 """Validators module - VLM-based test validation."""
 
-from .gemini_vlm import GeminiValidator, VLMValidationResult, load_api_key
+from .gemini_vlm import GeminiValidator, ValidationBatch, VLMValidationResult, load_api_key
 from .assertion_engine import AssertionEngine, AssertionReport, AssertionResult
 
 __all__ = [
     "GeminiValidator",
+    "ValidationBatch",
     "VLMValidationResult",
     "load_api_key",
     "AssertionEngine",
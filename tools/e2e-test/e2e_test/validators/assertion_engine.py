@@ -3,12 +3,16 @@
 Combines VLM validation results with assertion definitions.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional
 
 from ..scenario.schema import Assertion
 from .gemini_vlm import GeminiValidator, VLMValidationResult
 
+# Maximum concurrent VLM validations per evaluate() call.
+VLM_WORKERS = 8
+
 
 @dataclass
 class AssertionResult:
@@ -20,7 +24,7 @@ class AssertionResult:
     vlm_result: Optional[VLMValidationResult] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class AssertionReport:
     """Report of all assertion evaluations."""
     results: list[AssertionResult] = field(default_factory=list)
@@ -49,84 +53,156 @@ class AssertionReport:
 class AssertionEngine:
     """Evaluates test assertions using available validators."""
 
-    def __init__(self, gemini_validator: Optional[GeminiValidator] = None):
+    def __init__(
+        self,
+        gemini_validator: Optional[GeminiValidator] = None,
+        batch_vlm: bool = False,
+    ):
         """Initialize assertion engine.
 
         Args:
             gemini_validator: Gemini VLM validator for screenshot assertions.
                              If None, screenshot assertions will fail with message.
+            batch_vlm: If True, validate all screenshot assertions in one
+                       Gemini Batch job instead of concurrent per-assertion
+                       VLM calls.
         """
         self.gemini_validator = gemini_validator
+        self.batch_vlm = batch_vlm
 
     def evaluate(
         self,
         assertions: list[Assertion],
-        screenshots: dict[str, str],  # name -> base64 data
+        screenshots: dict[str, str | bytes],  # name -> base64 data or PNG bytes
     ) -> AssertionReport:
         """Evaluate all assertions against test results.
 
         Args:
             assertions: List of assertions from the scenario.
-            screenshots: Dict mapping screenshot names to base64 data.
+            screenshots: Dict mapping screenshot names to base64 data, or
+                to raw image bytes for results fetched as multipart.
 
         Returns:
             AssertionReport with individual results.
         """
-        report = AssertionReport()
+        results: list[Optional[AssertionResult]] = []
+        pending: list[tuple[int, Assertion, str | bytes]] = []
 
+        # Resolve everything that needs no VLM call; queue the rest.
         for assertion in assertions:
-            if assertion.type == "screenshot":
-                result = self._evaluate_screenshot(assertion, screenshots)
-            else:
-                result = AssertionResult(
+            if assertion.type != "screenshot":
+                results.append(_unsupported(assertion))
+                continue
+
+            screenshot_data = _find_screenshot(assertion.name, screenshots)
+            if screenshot_data is None:
+                results.append(_not_found(assertion))
+                continue
+
+            if self.gemini_validator is None:
+                results.append(AssertionResult(
                     assertion=assertion,
                     passed=False,
-                    details=f"Unsupported assertion type: {assertion.type}",
-                )
+                    skipped=True,
+                    details="No VLM validator configured. Screenshot assertion skipped.",
+                ))
+                continue
 
-            report.results.append(result)
+            pending.append((len(results), assertion, screenshot_data))
+            results.append(None)
 
-        return report
+        if pending:
+            if self.batch_vlm:
+                vlm_results = self._validate_batch(pending)
+            else:
+                vlm_results = self._validate_concurrently(pending)
+            for (index, assertion, _), vlm_result in zip(pending, vlm_results):
+                results[index] = _from_vlm(assertion, vlm_result)
+
+        return AssertionReport(results=results)
+
+    def _validate_batch(
+        self,
+        pending: list[tuple[int, Assertion, str | bytes]],
+    ) -> list[VLMValidationResult]:
+        """Validate every queued screenshot in one Gemini Batch job."""
+        return self.gemini_validator.validate_screenshots_batch([
+            ([screenshot_data], _expected(assertion))
+            for _, assertion, screenshot_data in pending
+        ])
+
+    def _validate_concurrently(
+        self,
+        pending: list[tuple[int, Assertion, str | bytes]],
+    ) -> list[VLMValidationResult]:
+        """Validate queued screenshots with up to VLM_WORKERS calls in flight.
 
-    def _evaluate_screenshot(
+        Each call is I/O bound (a VLM subprocess and API round trip), so
+        running them side by side takes about as long as the slowest one.
+        """
+        validate = self._validate_one
+        if len(pending) == 1:
+            _, assertion, screenshot_data = pending[0]
+            return [validate(screenshot_data, _expected(assertion))]
+
+        workers = min(VLM_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(validate, screenshot_data, _expected(assertion))
+                for _, assertion, screenshot_data in pending
+            ]
+            return [future.result() for future in futures]
+
+    def _validate_one(
         self,
-        assertion: Assertion,
-        screenshots: dict[str, str],
-    ) -> AssertionResult:
-        """Evaluate a screenshot assertion."""
-        # Find matching screenshot
-        screenshot_data = screenshots.get(assertion.name)
-
-        if screenshot_data is None:
-            # Try finding by partial match
-            for name, data in screenshots.items():
-                if assertion.name in name:
-                    screenshot_data = data
-                    break
-
-        if screenshot_data is None:
-            return AssertionResult(
-                assertion=assertion,
-                passed=False,
-                details=f"Screenshot '{assertion.name}' not found in results.",
-            )
-
-        if self.gemini_validator is None:
-            return AssertionResult(
-                assertion=assertion,
-                passed=False,
-                skipped=True,
-                details="No VLM validator configured. Screenshot assertion skipped.",
-            )
-
-        expected = assertion.description or assertion.name
-        vlm_result = self.gemini_validator.validate_screenshot(
-            screenshot_data, expected
-        )
-
-        return AssertionResult(
-            assertion=assertion,
-            passed=vlm_result.passed,
-            details=vlm_result.reason,
-            vlm_result=vlm_result,
-        )
+        screenshot_data: str | bytes,
+        expected: str,
+    ) -> VLMValidationResult:
+        """Validate one screenshot, skipping base64 when it is already raw bytes."""
+        if isinstance(screenshot_data, bytes):
+            return self.gemini_validator.validate_screenshot_bytes(screenshot_data, expected)
+        return self.gemini_validator.validate_screenshot(screenshot_data, expected)
+
+
+def _expected(assertion: Assertion) -> str:
+    return assertion.description or assertion.name
+
+
+def _find_screenshot(
+    name: str,
+    screenshots: dict[str, str | bytes],
+) -> Optional[str | bytes]:
+    """Find screenshot data by exact name, then by partial match."""
+    screenshot_data = screenshots.get(name)
+
+    if screenshot_data is None:
+        for screenshot_name, data in screenshots.items():
+            if name in screenshot_name:
+                return data
+
+    return screenshot_data
+
+
+def _unsupported(assertion: Assertion) -> AssertionResult:
+    return AssertionResult(
+        assertion=assertion,
+        passed=False,
+        details=f"Unsupported assertion type: {assertion.type}",
+    )
+
+
+def _not_found(assertion: Assertion) -> AssertionResult:
+    return AssertionResult(
+        assertion=assertion,
+        passed=False,
+        details=f"Screenshot '{assertion.name}' not found in results.",
+    )
+
+
+def _from_vlm(assertion: Assertion, vlm_result: VLMValidationResult) -> AssertionResult:
+    return AssertionResult(
+        assertion=assertion,
+        passed=vlm_result.passed,
+        details=vlm_result.reason,
+        vlm_result=vlm_result,
+    )
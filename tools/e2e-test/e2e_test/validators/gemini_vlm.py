@@ -5,18 +5,62 @@ E2E module delegates VLM execution to `.flow/bin/gemini_vlm.py`.
 
 from __future__ import annotations
 
+import atexit
 import base64
+import functools
+import hashlib
+import itertools
 import json
 import os
+import re
 import shutil
 import subprocess
 import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Iterable, Iterator, Optional, Sequence
 
+from ..utils.json_compat import loads as json_loads
 
-@dataclass
+try:
+    import blake3
+except ImportError:  # pragma: no cover - optional dependency
+    blake3 = None
+
+try:
+    import pybase64
+except ImportError:  # pragma: no cover - optional dependency
+    pybase64 = None
+
+# SIMD decoder when pybase64 is installed. Screenshots come from our own
+# capture path, so characters are not validated (same as base64.b64decode).
+_b64decode = pybase64.b64decode if pybase64 is not None else base64.b64decode
+
+# The whole alphabet plus whitespace anywhere (line breaks, wrapped or
+# indented text), with padding only at the end. b64decode silently drops
+# anything else, so garbage would otherwise still reach the VLM as a
+# broken image.
+_BASE64_TEXT_RE = re.compile(r"[A-Za-z0-9+/\s]*(?:=\s*){0,2}")
+# Same text without any whitespace: safe to decode in fixed-size slices.
+_PLAIN_BASE64_RE = re.compile(r"[A-Za-z0-9+/]*={0,2}")
+
+# Content hash behind the verdict cache keys: BLAKE3 (SIMD, several GB/s)
+# when installed, otherwise BLAKE2b. Keys never leave the process, so the
+# two need not agree.
+_new_hash = blake3.blake3 if blake3 is not None else functools.partial(hashlib.blake2b, digest_size=16)
+
+# Bytes read per chunk when hashing a screenshot file.
+HASH_CHUNK_BYTES = 1024 * 1024
+
+# Base64 characters decoded per write when spooling a screenshot to disk
+# (a multiple of 4, so slices decode independently).
+DECODE_CHUNK_CHARS = 192 * 1024
+
+
+@dataclass(slots=True, frozen=True)
 class VLMValidationResult:
     """Result of VLM screenshot validation."""
 
@@ -43,22 +87,18 @@ def load_api_key(env_path: Optional[Path] = None) -> str:
     if env_path is None:
         env_path = Path.home() / ".flow" / "env"
 
-    if not env_path.exists():
+    try:
+        mtime = env_path.stat().st_mtime
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Gemini API key not found.\n"
             f"Set GEMINI_API_KEY environment variable, or\n"
             f"Create {env_path} with: GEMINI_API_KEY=your_key_here"
-        )
+        ) from None
 
-    with open(env_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith("#") or not line:
-                continue
-            if line.startswith("GEMINI_API_KEY="):
-                key = line.split("=", 1)[1].strip()
-                if key and key != "your_api_key_here":
-                    return key
+    key = _parse_env_file(str(env_path), mtime).get("GEMINI_API_KEY")
+    if key:
+        return key
 
     raise ValueError(
         f"GEMINI_API_KEY not found or is placeholder in {env_path}.\n"
@@ -66,6 +106,25 @@ def load_api_key(env_path: Optional[Path] = None) -> str:
     )
 
 
+# One KEY=VALUE assignment per line; comment lines never match because a
+# name cannot start with "#".
+_ENV_ASSIGNMENT_RE = re.compile(r"^[ \t]*([^#=\s][^=\n]*?)[ \t]*=[ \t]*(\S[^\n]*?)[ \t]*$", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_env_file(path: str, mtime: float) -> dict[str, str]:
+    """KEY=VALUE pairs of an env file; cached until its mtime changes.
+
+    The first non-empty, non-placeholder value of each key wins.
+    """
+    values: dict[str, str] = {}
+    text = Path(path).read_text(encoding="utf-8")
+    for name, value in _ENV_ASSIGNMENT_RE.findall(text):
+        if value != "your_api_key_here":
+            values.setdefault(name, value)
+    return values
+
+
 class GeminiValidator:
     """Delegates screenshot validation to `.flow/bin/gemini_vlm.py`."""
 
@@ -73,6 +132,12 @@ class GeminiValidator:
     DEFAULT_CONFIDENCE_THRESHOLD = 0.8
     DEFAULT_TEMPERATURE = 0.0
     DEFAULT_TOP_P = 0.0
+    COMMAND_TIMEOUT = 120
+    # Batch jobs are asynchronous on Gemini's side; the script waits up to
+    # 24 hours, so leave it a little headroom.
+    BATCH_TIMEOUT = 24 * 60 * 60 + 300
+    # Verdicts remembered per validator, keyed by (image digest, prompt).
+    VLM_CACHE_MAX = 256
 
     def __init__(
         self,
@@ -81,12 +146,37 @@ class GeminiValidator:
         confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
         temperature: float = DEFAULT_TEMPERATURE,
         top_p: float = DEFAULT_TOP_P,
+        persistent_worker: bool = True,
+        cache_results: bool = True,
     ):
+        """Initialize the proxy validator.
+
+        Args:
+            api_key: Gemini API key passed to the script (None = its own lookup).
+            model_name: Gemini model name.
+            confidence_threshold: Confidence below which a warning is added.
+            temperature: Generation temperature.
+            top_p: Generation top_p.
+            persistent_worker: Keep one ``gemini_vlm.py --serve --stdio``
+                process for all validations instead of starting the script
+                per call. Falls back to per-call runs if the worker can't
+                be started.
+            cache_results: Reuse the verdict for screenshots (by content
+                hash) and prompt already validated by this instance. Turn
+                off to call the model every time, e.g. for regression runs.
+        """
         self.api_key = api_key
         self.model_name = model_name or self.DEFAULT_MODEL
         self.confidence_threshold = confidence_threshold
         self.temperature = temperature
         self.top_p = top_p
+        self._vlm_cache: OrderedDict[tuple[str, str], VLMValidationResult] = OrderedDict()
+        self._vlm_cache_lock = threading.Lock()
+        self._cache_results = cache_results
+        self._persistent_worker = persistent_worker
+        self._worker: Optional[_VLMWorker] = None
+        self._worker_lock = threading.Lock()
+        self._child_env: Optional[dict[str, str]] = None
 
     def validate_screenshot(
         self,
@@ -96,20 +186,38 @@ class GeminiValidator:
     ) -> VLMValidationResult:
         return self.validate_screenshots([screenshot_data], expected, prompt_template)
 
+    def validate_screenshot_bytes(
+        self,
+        image_bytes: bytes,
+        expected: str,
+        prompt_template: Optional[str] = None,
+    ) -> VLMValidationResult:
+        """Validate a raw PNG without a base64 round trip."""
+        return self.validate_screenshots_bytes([image_bytes], expected, prompt_template)
+
+    def validate_screenshots_bytes(
+        self,
+        images: Sequence[bytes],
+        expected: str,
+        prompt_template: Optional[str] = None,
+    ) -> VLMValidationResult:
+        """Validate raw images; they are written to temp files as-is.
+
+        For in-process captures this avoids encoding to base64 only to have
+        the validator decode it again. Callers holding files should use
+        validate_screenshot_files, which passes the paths straight through.
+        """
+        return self.validate_screenshots(images, expected, prompt_template)
+
     def validate_screenshots(
         self,
-        screenshot_data_list: Sequence[str],
+        screenshot_data_list: Sequence[str | bytes],
         expected: str,
         prompt_template: Optional[str] = None,
     ) -> VLMValidationResult:
-        if not screenshot_data_list:
-            return VLMValidationResult(False, 0.0, "At least one screenshot is required.")
-        if len(screenshot_data_list) > 3:
-            return VLMValidationResult(
-                False,
-                0.0,
-                f"Maximum 3 screenshots supported (got {len(screenshot_data_list)}).",
-            )
+        count_error = _count_error(screenshot_data_list)
+        if count_error is not None:
+            return count_error
 
         prompt = expected
         if prompt_template:
@@ -118,19 +226,52 @@ class GeminiValidator:
             except KeyError:
                 prompt = prompt_template.format(expected=expected)
 
-        with tempfile.TemporaryDirectory(prefix="flow-vlm-") as tmp_dir:
-            image_paths: list[Path] = []
-            for index, screenshot_data in enumerate(screenshot_data_list):
-                try:
-                    image_bytes = base64.b64decode(screenshot_data)
-                except Exception as e:
-                    return VLMValidationResult(False, 0.0, f"Invalid base64 screenshot data: {e}")
+        worker = self._get_worker()
+        use_worker = True
+        if worker is not None:
+            # The worker takes the PNG bytes inline on its stdin, so no temp
+            # files are written.
+            try:
+                images, images_digest = _decode_images(screenshot_data_list)
+            except (ValueError, TypeError) as e:
+                return VLMValidationResult(False, 0.0, f"Invalid base64 screenshot data: {e}")
+
+            cache_key = (images_digest, prompt)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
 
-                image_path = Path(tmp_dir) / f"image_{index + 1}.png"
-                image_path.write_bytes(image_bytes)
-                image_paths.append(image_path)
+            parsed, error = self._request_worker(
+                worker, [{"len": len(image)} for image in images], prompt, images
+            )
+            if error is None or not worker.crashed:
+                return self._store_result(parsed, error, cache_key)
+            # The worker died; retry below through temp files and a
+            # one-shot run.
+            use_worker = False
 
-            return self._invoke_flow_vlm(image_paths, prompt)
+        # Per-thread names in the shared scratch dir: concurrent callers
+        # never collide, and no directory is created or removed per call.
+        path_prefix = _scratch_dir() / f"image_{threading.get_ident()}"
+        try:
+            try:
+                image_paths, images_digest = _write_images(path_prefix, screenshot_data_list)
+            except (ValueError, TypeError) as e:
+                return VLMValidationResult(False, 0.0, f"Invalid base64 screenshot data: {e}")
+
+            cache_key = (images_digest, prompt)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+            return self._invoke_flow_vlm(image_paths, prompt, cache_key, use_worker)
+        finally:
+            # Screenshots are not left on disk between calls.
+            for image_path in _image_paths(path_prefix, len(screenshot_data_list)):
+                try:
+                    image_path.unlink()
+                except FileNotFoundError:
+                    pass
 
     def validate_screenshot_file(self, screenshot_path: Path, expected: str) -> VLMValidationResult:
         return self.validate_screenshot_files([screenshot_path], expected)
@@ -156,80 +297,798 @@ class GeminiValidator:
                 return VLMValidationResult(False, 0.0, f"Screenshot file not found: {path}")
             normalized.append(path)
 
-        return self._invoke_flow_vlm(normalized, expected)
+        # Hashing the files costs a few milliseconds; a repeated screenshot
+        # then skips the model call entirely.
+        cache_key = None
+        if self._cache_results:
+            try:
+                cache_key = (_hash_files(normalized), expected)
+            except OSError:
+                cache_key = None
+            cached = self._cache_get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                return cached
 
-    def _invoke_flow_vlm(self, image_paths: Sequence[Path], expected: str) -> VLMValidationResult:
-        script_path = _resolve_flow_vlm_script()
-        if script_path is None:
-            return VLMValidationResult(
-                False,
-                0.0,
-                "Cannot find .flow/bin/gemini_vlm.py. Ensure Flow is installed and .flow/bin exists.",
-            )
+        return self._invoke_flow_vlm(normalized, expected, cache_key)
+
+    def validate_screenshots_batch(
+        self,
+        items: Sequence[tuple[Sequence[str | bytes], str]],
+    ) -> list[VLMValidationResult]:
+        """Validate many (screenshots, expected) pairs in one Gemini Batch job.
+
+        Runs `.flow/bin/gemini_vlm.py --batch` once for every item instead of
+        one process and API round trip per item. Batch jobs finish
+        asynchronously, so this suits non-interactive runs.
+
+        Args:
+            items: (screenshots, expected description) pairs; each
+                screenshot is base64 text or raw image bytes.
 
-        python_cmd = _resolve_python_command(script_path)
-        if not python_cmd:
-            return VLMValidationResult(False, 0.0, "Python executable not found.")
+        Returns:
+            One result per item, in input order.
+        """
+        results: list[Optional[VLMValidationResult]] = [None] * len(items)
+        if not items:
+            return []
 
-        args: list[str] = [str(script_path)]
-        for image_path in image_paths:
-            args.extend(["--image", str(image_path)])
-        args.extend(["--expected", expected])
+        with tempfile.TemporaryDirectory(prefix="flow-vlm-batch-") as tmp_dir:
+            entries: list[dict] = []
+            pending: list[int] = []
+            cache_keys: list[tuple[str, str]] = []
+            for index, (screenshot_data_list, expected) in enumerate(items):
+                results[index] = _count_error(screenshot_data_list)
+                if results[index] is not None:
+                    continue
+
+                try:
+                    image_paths, images_digest = _write_images(
+                        Path(tmp_dir) / f"item_{index + 1}_image", screenshot_data_list
+                    )
+                except (ValueError, TypeError) as e:
+                    results[index] = VLMValidationResult(False, 0.0, f"Invalid base64 screenshot data: {e}")
+                    continue
+
+                cache_key = (images_digest, expected)
+                cached = self._cache_get(cache_key)
+                if cached is not None:
+                    results[index] = cached
+                    continue
+
+                entries.append({"images": [str(path) for path in image_paths], "expected": expected})
+                pending.append(index)
+                cache_keys.append(cache_key)
+
+            if pending:
+                batch_path = Path(tmp_dir) / "batch.json"
+                batch_path.write_text(json.dumps(entries, ensure_ascii=False), encoding="utf-8")
+                parsed, error = self._run_flow_vlm(
+                    ["--batch", str(batch_path)], timeout=self.BATCH_TIMEOUT
+                )
+                batch_results = parsed.get("results") if parsed is not None else None
+                if error is None and not isinstance(batch_results, list):
+                    reason = str(parsed.get("message") or "VLM batch returned no results.")
+                    error = VLMValidationResult(False, 0.0, reason)
+
+                for position, index in enumerate(pending):
+                    if error is None and position < len(batch_results):
+                        item_payload = batch_results[position]
+                        results[index] = _result_from_payload(item_payload)
+                        if _is_model_verdict(item_payload):
+                            self._cache_put(cache_keys[position], results[index])
+                    else:
+                        results[index] = error or VLMValidationResult(
+                            False, 0.0, "VLM batch returned no response for this request."
+                        )
+
+        return results
+
+    def begin_batch(self) -> ValidationBatch:
+        """Start collecting validations to send in one worker round trip.
+
+        Instead of::
+
+            results = [validator.validate_screenshot(s, e) for s, e in pairs]
+
+        write::
+
+            batch = validator.begin_batch()
+            for s, e in pairs:
+                batch.add(s, e)
+            results = batch.flush()
+        """
+        return ValidationBatch(self)
+
+    def validate_screenshots_many(
+        self,
+        items: Sequence[tuple[Sequence[str | bytes], str]],
+    ) -> list[VLMValidationResult]:
+        """Validate many (screenshots, expected) pairs in one worker request.
+
+        The persistent worker validates the items concurrently with a
+        single Gemini client and answers once, so there is one request line
+        and one response line rather than one round trip per item. Unlike
+        validate_screenshots_batch this is interactive (no Batch job).
+        Without a worker, each item is validated on its own.
+
+        Args:
+            items: (screenshots, expected description) pairs; each
+                screenshot is base64 text or raw image bytes.
+
+        Returns:
+            One result per item, in input order.
+        """
+        worker = self._get_worker()
+        if worker is None:
+            return [self.validate_screenshots(screenshots, expected) for screenshots, expected in items]
+
+        results: list[Optional[VLMValidationResult]] = [None] * len(items)
+        entries: list[dict] = []
+        blobs: list[bytes] = []
+        pending: list[int] = []
+        cache_keys: list[tuple[str, str]] = []
+        for index, (screenshot_data_list, expected) in enumerate(items):
+            results[index] = _count_error(screenshot_data_list)
+            if results[index] is not None:
+                continue
+            try:
+                images, images_digest = _decode_images(screenshot_data_list)
+            except (ValueError, TypeError) as e:
+                results[index] = VLMValidationResult(False, 0.0, f"Invalid base64 screenshot data: {e}")
+                continue
+
+            cache_key = (images_digest, expected)
+            results[index] = self._cache_get(cache_key)
+            if results[index] is not None:
+                continue
+
+            entries.append({"images": [{"len": len(image)} for image in images], "expected": expected})
+            blobs.extend(images)
+            pending.append(index)
+            cache_keys.append(cache_key)
+
+        if not pending:
+            return results
+
+        parsed, error = self._send_to_worker(
+            worker, {"op": "multi", "items": entries}, self.COMMAND_TIMEOUT * len(pending), blobs
+        )
+        if error is not None and worker.crashed:
+            # The worker died; validate what is left one by one.
+            for index in pending:
+                results[index] = self.validate_screenshots(*items[index])
+            return results
+
+        item_payloads = parsed.get("results") if parsed is not None else None
+        if error is None and not isinstance(item_payloads, list):
+            error = VLMValidationResult(False, 0.0, str(parsed.get("message") or "VLM returned no results."))
+        for position, index in enumerate(pending):
+            if error is None and position < len(item_payloads):
+                results[index] = self._store_result(item_payloads[position], None, cache_keys[position])
+            else:
+                results[index] = error or VLMValidationResult(
+                    False, 0.0, "VLM returned no response for this request."
+                )
+        return results
+
+    def warm_up(self) -> None:
+        """Start the persistent worker now, ahead of the first validation.
+
+        The worker imports the Gemini SDK as soon as it starts, so calling
+        this before other slow work (discovery, the device run) takes that
+        import off the first validation's latency. A no-op without a worker.
+        """
+        self._get_worker()
+
+    def close(self) -> None:
+        """Stop the persistent worker, if one is running."""
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _invoke_flow_vlm(
+        self,
+        image_paths: Sequence[Path],
+        expected: str,
+        cache_key: Optional[tuple[str, str]] = None,
+        use_worker: bool = True,
+    ) -> VLMValidationResult:
+        worker = self._get_worker() if use_worker else None
+        if worker is not None:
+            parsed, error = self._request_worker(worker, [str(path) for path in image_paths], expected)
+        else:
+            parsed, error = None, None
+        if worker is None or (error is not None and worker.crashed):
+            args: list[str] = []
+            for image_path in image_paths:
+                args.extend(["--image", str(image_path)])
+            args.extend(["--expected", expected])
+            parsed, error = self._run_flow_vlm(args, timeout=self.COMMAND_TIMEOUT)
+        return self._store_result(parsed, error, cache_key)
+
+    def _store_result(
+        self,
+        parsed: Optional[dict],
+        error: Optional[VLMValidationResult],
+        cache_key: Optional[tuple[str, str]],
+    ) -> VLMValidationResult:
+        """Turn a script payload into a result, caching model verdicts."""
+        if error is not None:
+            return error
+        result = _result_from_payload(parsed)
+        if cache_key is not None and _is_model_verdict(parsed):
+            self._cache_put(cache_key, result)
+        return result
+
+    def _cache_get(self, key: tuple[str, str]) -> Optional[VLMValidationResult]:
+        if not self._cache_results:
+            return None
+        with self._vlm_cache_lock:
+            return self._vlm_cache.get(key)
+
+    def _cache_put(self, key: tuple[str, str], result: VLMValidationResult) -> None:
+        if not self._cache_results:
+            return
+        with self._vlm_cache_lock:
+            self._vlm_cache[key] = result
+            if len(self._vlm_cache) > self.VLM_CACHE_MAX:
+                self._vlm_cache.popitem(last=False)
+
+    def _get_worker(self) -> Optional[_VLMWorker]:
+        """The running persistent worker, started on first use; None to run per call."""
+        if not self._persistent_worker:
+            return None
+        with self._worker_lock:
+            if self._worker is not None and self._worker.alive:
+                return self._worker
+            command, error = _flow_vlm_command()
+            if error is not None:
+                return None
+            try:
+                self._worker = _VLMWorker([*command, "--serve", "--stdio"], self._subprocess_env())
+            except OSError:
+                self._persistent_worker = False
+                self._worker = None
+            return self._worker
+
+    def _discard_worker(self, worker: _VLMWorker) -> None:
+        with self._worker_lock:
+            if self._worker is worker:
+                self._worker = None
+        worker.kill()
+
+    def _request_worker(
+        self,
+        worker: _VLMWorker,
+        images: list,
+        expected: str,
+        blobs: Sequence[bytes] = (),
+    ) -> tuple[Optional[dict], Optional[VLMValidationResult]]:
+        """Validate through the persistent worker and return (payload, error).
+
+        images are file paths, or {"len": N} entries describing blobs, the
+        raw image bytes sent right after the request line.
+        """
+        request = {"op": "validate", "images": images, "expected": expected}
+        return self._send_to_worker(worker, request, self.COMMAND_TIMEOUT, blobs)
+
+    def _send_to_worker(
+        self,
+        worker: _VLMWorker,
+        request: dict,
+        timeout: float,
+        blobs: Sequence[bytes] = (),
+    ) -> tuple[Optional[dict], Optional[VLMValidationResult]]:
+        """Send request with this validator's settings; return (payload, error)."""
+        request = {
+            **request,
+            "cwd": os.getcwd(),
+            "model": self.model_name,
+            "confidence": self.confidence_threshold,
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+        }
+        try:
+            response = worker.request(request, timeout=timeout, blobs=blobs)
+        except FutureTimeoutError:
+            # A worker that misses the deadline is presumed hung: left in
+            # place it would make every later call wait out the timeout too.
+            # Kill it so the next call starts a fresh worker. The timeout is
+            # returned as is: a one-shot retry would double the wait for a
+            # request that may simply be slow.
+            self._discard_worker(worker)
+            return None, VLMValidationResult(False, 0.0, "VLM command timed out.")
+        except OSError as e:
+            if not worker.answered:
+                # The script exited before answering anything (e.g. an older
+                # copy without --stdio): stop trying the worker.
+                self._persistent_worker = False
+            return None, VLMValidationResult(False, 0.0, f"VLM worker failed: {e}")
+
+        payload = response.get("payload")
+        if not isinstance(payload, dict):
+            return None, VLMValidationResult(False, 0.0, "VLM worker returned no payload.")
+        return payload, None
+
+    def _subprocess_env(self) -> Optional[dict[str, str]]:
+        """Environment for the script; None (inherit ours) when nothing changes.
+
+        Passing env=None lets the child reuse this process's environment
+        block instead of a rebuilt copy. An override is built once.
+        """
+        if not self.api_key or os.environ.get("GEMINI_API_KEY") == self.api_key:
+            return None
+        env = self._child_env
+        if env is None or env.get("GEMINI_API_KEY") != self.api_key:
+            env = self._child_env = {**os.environ, "GEMINI_API_KEY": self.api_key}
+        return env
+
+    def _run_flow_vlm(
+        self,
+        request_args: Sequence[str],
+        timeout: float,
+    ) -> tuple[Optional[dict], Optional[VLMValidationResult]]:
+        """Run the flow VLM script once and return (parsed JSON payload, error)."""
+        command, error = _flow_vlm_command()
+        if error is not None:
+            return None, error
+
+        args: list[str] = [*request_args]
         args.extend(["--confidence", str(self.confidence_threshold)])
         args.extend(["--temperature", str(self.temperature)])
         args.extend(["--top-p", str(self.top_p)])
         if self.model_name:
             args.extend(["--model", self.model_name])
 
-        env = os.environ.copy()
-        if self.api_key:
-            env["GEMINI_API_KEY"] = self.api_key
+        env = self._subprocess_env()
 
         try:
+            # One pipe for both streams: the payload is found among any
+            # log lines, so stderr needs no pipe (or reader) of its own.
+            # Python's own descriptors are non-inheritable, so close_fds
+            # is not needed, and without it CPython can use posix_spawn.
             process = subprocess.run(
-                python_cmd + args,
-                capture_output=True,
-                text=True,
-                timeout=120,
+                [*command, *args],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                timeout=timeout,
                 env=env,
+                close_fds=False,
             )
         except subprocess.TimeoutExpired:
-            return VLMValidationResult(False, 0.0, "VLM command timed out.")
+            return None, VLMValidationResult(False, 0.0, "VLM command timed out.")
         except OSError as e:
-            return VLMValidationResult(False, 0.0, f"Failed to execute VLM command: {e}")
+            return None, VLMValidationResult(False, 0.0, f"Failed to execute VLM command: {e}")
 
-        response_text = (process.stdout or process.stderr or "").strip()
-        parsed = _parse_json_payload(response_text)
+        # Raw bytes go straight to the JSON decoder (orjson skips the UTF-8
+        # decode step entirely); only an error message needs text.
+        response = process.stdout.strip()
+        parsed = _parse_json_payload(response)
         if parsed is None:
-            return VLMValidationResult(False, 0.0, f"Cannot parse VLM response: {response_text[:200]}")
+            snippet = response[:200].decode("utf-8", "replace")
+            return None, VLMValidationResult(False, 0.0, f"Cannot parse VLM response: {snippet}")
+        return parsed, None
+
+
+class ValidationBatch:
+    """Validations collected by GeminiValidator.begin_batch, sent on flush()."""
+
+    def __init__(self, validator: GeminiValidator):
+        self._validator = validator
+        self._items: list[tuple[list[str | bytes], str]] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, screenshot_data: str | bytes | Sequence[str | bytes], expected: str) -> int:
+        """Queue one validation; returns its index in flush()'s results.
+
+        screenshot_data is one screenshot (base64 text or raw bytes) or a
+        sequence of up to 3 of them.
+        """
+        if isinstance(screenshot_data, (str, bytes, bytearray, memoryview)):
+            screenshot_data = [screenshot_data]
+        self._items.append((list(screenshot_data), expected))
+        return len(self._items) - 1
+
+    def flush(self) -> list[VLMValidationResult]:
+        """Validate everything queued since the last flush, in one request."""
+        items, self._items = self._items, []
+        if not items:
+            return []
+        return self._validator.validate_screenshots_many(items)
+
+
+class _VLMWorker:
+    """A ``gemini_vlm.py --serve --stdio`` process shared by concurrent callers.
+
+    Requests are tagged with an id and written one JSON line each, followed
+    by any inline image bytes; a reader thread hands every response line to
+    the caller waiting on that id, so several validations can be in flight
+    at once.
+    """
+
+    def __init__(self, command: Sequence[str], env: Optional[dict[str, str]]):
+        # close_fds=False: see GeminiValidator._run_flow_vlm.
+        self._process = subprocess.Popen(
+            list(command),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            close_fds=False,
+        )
+        self._pending: dict[int, Future] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.answered = False
+        self._killed = False
+        self._reader = threading.Thread(target=self._read_responses, name="flow-vlm-worker", daemon=True)
+        self._reader.start()
+
+    @property
+    def alive(self) -> bool:
+        return self._process.poll() is None
+
+    @property
+    def crashed(self) -> bool:
+        """True when the process exited on its own (not through kill())."""
+        return not self._killed and not self.alive
+
+    def request(self, request: dict, timeout: float, blobs: Sequence[bytes] = ()) -> dict:
+        """Send one request (and any raw image blobs) and wait for its response line.
+
+        Raises:
+            concurrent.futures.TimeoutError: If no response arrives in time.
+            OSError: If the worker has exited or its pipe is closed.
+        """
+        future: Future = Future()
+        with self._lock:
+            if not self.alive:
+                raise OSError("VLM worker is not running")
+            request_id = next(self._ids)
+            self._pending[request_id] = future
+            line = json.dumps({**request, "id": request_id}, ensure_ascii=False) + "\n"
+            try:
+                stdin = self._process.stdin
+                stdin.write(line.encode("utf-8"))
+                for blob in blobs:
+                    stdin.write(blob)
+                stdin.flush()
+            except (OSError, ValueError) as e:
+                self._pending.pop(request_id, None)
+                raise OSError(f"VLM worker pipe closed: {e}") from None
+        try:
+            return future.result(timeout)
+        finally:
+            with self._lock:
+                self._pending.pop(request_id, None)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Ask the worker to quit, and kill it if it does not exit in time."""
+        try:
+            with self._lock:
+                self._process.stdin.write(b'{"op": "quit"}\n')
+                self._process.stdin.close()
+        except (OSError, ValueError):
+            pass
+        try:
+            self._process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            self.kill()
+
+    def kill(self) -> None:
+        """Stop the worker now; requests still in flight fail with OSError."""
+        self._killed = True
+        try:
+            self._process.kill()
+        except OSError:
+            pass
+        self._process.wait()
+
+    def _read_responses(self) -> None:
+        for line in self._process.stdout:
+            try:
+                response = json_loads(line)
+            except ValueError:
+                continue
+            if not isinstance(response, dict):
+                continue
+            self.answered = True
+            with self._lock:
+                future = self._pending.pop(response.get("id"), None)
+            if future is not None:
+                future.set_result(response)
+
+        # EOF: the worker is gone; fail whoever is still waiting.
+        self._process.wait()
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(OSError("VLM worker exited"))
+
+
+def _flow_vlm_command() -> tuple[list[str], Optional[VLMValidationResult]]:
+    """(interpreter + script command, error) for running gemini_vlm.py."""
+    script_path = _resolve_flow_vlm_script()
+    if script_path is None:
+        return [], VLMValidationResult(
+            False,
+            0.0,
+            "Cannot find .flow/bin/gemini_vlm.py. Ensure Flow is installed and .flow/bin exists.",
+        )
+
+    python_cmd = _resolve_python_command(script_path)
+    if not python_cmd:
+        return [], VLMValidationResult(False, 0.0, "Python executable not found.")
+    return [*python_cmd, str(script_path)], None
+
+
+def _write_images(
+    path_prefix: Path,
+    screenshot_data_list: Sequence[str | bytes],
+) -> tuple[list[Path], str]:
+    """Write screenshots to ``<path_prefix>_<n>.png`` and digest their content.
+
+    Returns:
+        (image paths, hex digest of the ordered decoded images).
+
+    Raises:
+        ValueError: If a screenshot is not valid base64.
+    """
+    image_paths = _image_paths(path_prefix, len(screenshot_data_list))
+    digests = _map_images(_write_image, image_paths, screenshot_data_list)
+    return image_paths, _combine_digests(digests)
+
 
+def _image_paths(path_prefix: Path, count: int) -> list[Path]:
+    return [path_prefix.with_name(f"{path_prefix.name}_{index + 1}.png") for index in range(count)]
+
+
+def _write_image(image_path: Path, screenshot_data: str | bytes) -> bytes:
+    digest = _new_hash()
+    size = 0
+    # Unbuffered: each decoded chunk is already large, so it goes to the
+    # kernel in one write call instead of through a BufferedWriter copy.
+    fd = os.open(image_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o600)
+    try:
+        for chunk in _decoded_chunks(screenshot_data):
+            _write_all(fd, chunk)
+            digest.update(chunk)
+            size += len(chunk)
+    finally:
+        os.close(fd)
+    # Length after the image keeps the digest unambiguous.
+    digest.update(size.to_bytes(8, "little"))
+    return digest.digest()
+
+
+def _write_all(fd: int, data: bytes | bytearray | memoryview) -> None:
+    """os.write until everything is written (a write may be partial)."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _decode_images(screenshot_data_list: Sequence[str | bytes]) -> tuple[list[bytes], str]:
+    """Decode screenshots in memory; same digest as _write_images.
+
+    Raises:
+        ValueError: If a screenshot is not valid base64.
+    """
+    decoded = _map_images(_decode_image, screenshot_data_list)
+    return [image for image, _ in decoded], _combine_digests(digest for _, digest in decoded)
+
+
+def _decode_image(screenshot_data: str | bytes) -> tuple[bytes, bytes]:
+    if isinstance(screenshot_data, (bytes, bytearray, memoryview)):
+        image = bytes(screenshot_data)
+    else:
+        _check_base64(screenshot_data)
+        image = _b64decode(screenshot_data)
+    digest = _new_hash(image)
+    digest.update(len(image).to_bytes(8, "little"))
+    return image, digest.digest()
+
+
+def _hash_files(paths: Sequence[Path]) -> str:
+    """Same digest _write_images gives for these files' contents."""
+    digests: list[bytes] = []
+    for path in paths:
+        digest = _new_hash()
+        size = 0
+        with open(path, "rb") as f:
+            while chunk := f.read(HASH_CHUNK_BYTES):
+                digest.update(chunk)
+                size += len(chunk)
+        digest.update(size.to_bytes(8, "little"))
+        digests.append(digest.digest())
+    return _combine_digests(digests)
+
+
+def _combine_digests(digests: Iterable[bytes]) -> str:
+    """Hex digest of the ordered per-image digests."""
+    combined = _new_hash()
+    for digest in digests:
+        combined.update(digest)
+    return combined.hexdigest()
+
+
+def _map_images(function, *iterables: Sequence) -> list:
+    """map() over the screenshots of one call, in parallel when there are several.
+
+    The writes are I/O bound and pybase64 decodes outside the GIL, so up to
+    three images (the per-call maximum) are handled side by side. A single
+    image skips the pool.
+    """
+    if len(iterables[0]) <= 1:
+        return list(map(function, *iterables))
+    return list(_decode_pool().map(function, *iterables))
+
+
+@functools.lru_cache(maxsize=1)
+def _scratch_dir() -> Path:
+    """Per-process directory for spooled screenshots, removed at exit."""
+    scratch_dir = Path(tempfile.mkdtemp(prefix="flow-vlm-"))
+    atexit.register(shutil.rmtree, scratch_dir, ignore_errors=True)
+    return scratch_dir
+
+
+@functools.lru_cache(maxsize=1)
+def _decode_pool() -> ThreadPoolExecutor:
+    """Shared pool for _map_images, created on first multi-image call."""
+    return ThreadPoolExecutor(max_workers=3, thread_name_prefix="vlm-decode")
+
+
+def _decoded_chunks(screenshot_data: str | bytes) -> Iterator[bytes]:
+    """Decoded image bytes, in DECODE_CHUNK_CHARS slices for large base64 text.
+
+    Slicing on a multiple of 4 characters keeps every slice independently
+    decodable (padding only occurs in the last). Text with whitespace
+    can't be sliced on fixed boundaries and is decoded in one go; raw
+    bytes pass through untouched.
+    """
+    if isinstance(screenshot_data, (bytes, bytearray, memoryview)):
+        yield screenshot_data
+        return
+    plain = _check_base64(screenshot_data)
+    if len(screenshot_data) <= DECODE_CHUNK_CHARS or not plain:
+        yield _b64decode(screenshot_data)
+        return
+    for start in range(0, len(screenshot_data), DECODE_CHUNK_CHARS):
+        yield _b64decode(screenshot_data[start:start + DECODE_CHUNK_CHARS])
+
+
+def _count_error(screenshot_data_list: Sequence) -> Optional[VLMValidationResult]:
+    """The result to return when a call has no screenshots or more than 3."""
+    if not screenshot_data_list:
+        return VLMValidationResult(False, 0.0, "At least one screenshot is required.")
+    if len(screenshot_data_list) > 3:
         return VLMValidationResult(
-            passed=bool(parsed.get("success", False)),
-            confidence=float(parsed.get("confidence", 0.0)),
-            reason=str(parsed.get("reason") or parsed.get("message") or "No reason provided"),
-            warning=parsed.get("warning"),
+            False,
+            0.0,
+            f"Maximum 3 screenshots supported (got {len(screenshot_data_list)}).",
         )
+    return None
+
+
+def _check_base64(screenshot_data: str) -> bool:
+    """Reject non-base64 text before anything is decoded.
+
+    Returns:
+        True if the text has no whitespace at all (the common case, settled
+        in one regex pass).
+
+    Raises:
+        ValueError: If screenshot_data contains characters outside the
+            base64 alphabet and whitespace, or padding before the end.
+    """
+    if _PLAIN_BASE64_RE.fullmatch(screenshot_data) is not None:
+        return True
+    if _BASE64_TEXT_RE.fullmatch(screenshot_data) is None:
+        raise ValueError("unexpected characters in base64 text")
+    return False
+
+
+def _is_model_verdict(parsed: dict) -> bool:
+    """True if a payload is the model's judgement rather than an error report.
+
+    Errors (missing key, unreadable image, API failure) come back with zero
+    confidence and must not be cached.
+    """
+    return bool(parsed.get("success")) or float(parsed.get("confidence", 0.0) or 0.0) > 0.0
+
+
+def _result_from_payload(parsed: dict) -> VLMValidationResult:
+    return VLMValidationResult(
+        passed=bool(parsed.get("success", False)),
+        confidence=float(parsed.get("confidence", 0.0)),
+        reason=str(parsed.get("reason") or parsed.get("message") or "No reason provided"),
+        warning=parsed.get("warning"),
+    )
 
 
-def _parse_json_payload(raw: str) -> Optional[dict]:
+def _parse_json_payload(raw: str | bytes) -> Optional[dict]:
+    """Return the first JSON object in raw, or None."""
     raw = raw.strip()
     if not raw:
         return None
 
-    try:
-        return json.loads(raw)
-    except json.JSONDecodeError:
-        start = raw.find("{")
-        end = raw.rfind("}")
-        if start == -1 or end == -1 or end <= start:
-            return None
+    if raw[:1] in ("{", b"{"):
         try:
-            return json.loads(raw[start : end + 1])
-        except json.JSONDecodeError:
-            return None
+            payload = json_loads(raw)
+        except ValueError:
+            pass
+        else:
+            if isinstance(payload, dict):
+                return payload
+
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8", "replace")
+
+    # Mixed output (log lines around the payload): take the first balanced
+    # object that decodes, ignoring whatever follows it.
+    start = raw.find("{")
+    while start != -1:
+        end = _json_object_end(raw, start)
+        payload = None
+        if end != -1:
+            try:
+                payload = json_loads(raw[start:end])
+            except ValueError:
+                pass
+        if isinstance(payload, dict):
+            return payload
+        start = raw.find("{", start + 1)
+    return None
+
+
+# Only these characters change the scanner state, so the regex skips
+# everything else at C speed.
+_JSON_STRUCTURE_RE = re.compile(r'[{}"\\]')
+
+
+def _json_object_end(raw: str, start: int) -> int:
+    """Return the index just past the object opened at raw[start], or -1.
+
+    Single pass over the text, tracking brace depth while skipping string
+    contents (so braces inside a reason do not count) and escapes.
+    """
+    depth = 0
+    in_string = False
+    escape_at = -1
+    for match in _JSON_STRUCTURE_RE.finditer(raw, start):
+        index = match.start()
+        if index == escape_at:
+            continue
+        char = raw[index]
+        if in_string:
+            if char == "\\":
+                escape_at = index + 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+    return -1
 
 
+@functools.lru_cache(maxsize=1)
 def _resolve_flow_vlm_script() -> Optional[Path]:
+    """Locate .flow/bin/gemini_vlm.py once per process."""
     current = Path(__file__).resolve()
     candidates = [
         current.parents[4] / ".flow" / "bin" / "gemini_vlm.py",  # repo/tools/e2e-test
@@ -241,21 +1100,23 @@ def _resolve_flow_vlm_script() -> Optional[Path]:
     return None
 
 
-def _resolve_python_command(script_path: Path) -> list[str]:
+@functools.lru_cache(maxsize=1)
+def _resolve_python_command(script_path: Path) -> tuple[str, ...]:
+    """Interpreter command for script_path, resolved once per process."""
     candidates = [
         script_path.parents[2] / ".venv" / "Scripts" / "python.exe",  # repo .venv
     ]
     for candidate in candidates:
         if candidate.exists():
-            return [str(candidate)]
+            return (str(candidate),)
 
     if os.name == "nt":
         py_launcher = shutil.which("py")
         if py_launcher:
-            return [py_launcher, "-3"]
+            return (py_launcher, "-3")
 
     python_bin = shutil.which("python")
     if python_bin:
-        return [python_bin]
+        return (python_bin,)
 
-    return []
+    return ()
@@ -15,6 +15,10 @@ setup(
         "google-generativeai>=0.3.0",
         "click>=8.1.0",
     ],
+    extras_require={
+        # Faster JSON parsing and base64 decoding; both are optional.
+        "fast": ["orjson>=3.9", "pybase64"],
+    },
     entry_points={
         "console_scripts": [
             "e2e-test=e2e_test.cli:main",